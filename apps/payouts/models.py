@@ -64,11 +64,21 @@ class PayoutAccount(models.Model):
         # Ensure only one primary account per vendor
         if self.is_primary:
             PayoutAccount.objects.filter(
-                vendor=self.vendor, 
+                vendor=self.vendor,
                 is_primary=True
             ).update(is_primary=False)
         super().save(*args, **kwargs)
 
+        # Keep the denormalized Vendor.primary_payout_account pointer in sync
+        vendor_model = type(self.vendor)
+        if self.is_primary:
+            vendor_model.objects.filter(pk=self.vendor_id).update(primary_payout_account=self)
+        else:
+            vendor_model.objects.filter(
+                pk=self.vendor_id,
+                primary_payout_account=self
+            ).update(primary_payout_account=None)
+
 
 class Payout(models.Model):
     class PayoutStatus(models.TextChoices):
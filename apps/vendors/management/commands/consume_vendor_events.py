@@ -0,0 +1,59 @@
+import json
+import logging
+
+from django.core.management.base import BaseCommand
+from django_redis import get_redis_connection
+
+from apps.vendors.tasks import send_vendor_email
+from shared.events import VENDOR_EVENTS_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+# Event type -> template key in VENDOR_EMAIL_TEMPLATES
+EVENT_EMAILS = {
+    'approved': 'approval',
+    'rejected': 'rejection',
+    'suspended': 'suspension',
+}
+
+
+class Command(BaseCommand):
+    """
+    Consume vendor lifecycle events and send the matching emails.
+
+    This is the subscriber side of shared.events.notify: moderation views
+    publish {'type': ..., 'vendor_id': ...} to the vendor.events channel
+    and this long-running process sends the corresponding notification
+    email. Run one instance alongside the web workers:
+
+        python manage.py consume_vendor_events
+    """
+    help = 'Consume vendor lifecycle events from Redis and send notification emails.'
+
+    def handle(self, *args, **options):
+        connection = get_redis_connection('default')
+        pubsub = connection.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(VENDOR_EVENTS_CHANNEL)
+        self.stdout.write(f"Listening for vendor events on '{VENDOR_EVENTS_CHANNEL}'")
+
+        for message in pubsub.listen():
+            try:
+                event = json.loads(message['data'])
+            except (TypeError, ValueError):
+                logger.warning(f"Discarding malformed vendor event: {message.get('data')!r}")
+                continue
+
+            template_key = EVENT_EMAILS.get(event.get('type'))
+            vendor_id = event.get('vendor_id')
+            if template_key is None or vendor_id is None:
+                logger.warning(f"Discarding unhandled vendor event: {event!r}")
+                continue
+
+            try:
+                # Call the task body directly; the email is sent from this
+                # process, which is the whole point of skipping the broker
+                send_vendor_email(template_key, vendor_id)
+            except Exception as e:
+                logger.error(
+                    f"Failed to send {template_key} email for vendor {vendor_id}: {str(e)}"
+                )
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendors', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='vendor',
+            name='business_name',
+            field=models.CharField(db_collation='NOCASE', max_length=255),
+        ),
+    ]
@@ -0,0 +1,24 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payouts', '0001_initial'),
+        ('vendors', '0002_vendor_business_name_ci_collation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vendor',
+            name='primary_payout_account',
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='+',
+                to='payouts.payoutaccount',
+            ),
+        ),
+    ]
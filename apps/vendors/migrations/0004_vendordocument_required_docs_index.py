@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendors', '0003_vendor_primary_payout_account'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vendordocument',
+            index=models.Index(
+                fields=['vendor', 'document_type', 'is_verified'],
+                name='vendor_docu_vendor__8a41f1_idx',
+            ),
+        ),
+    ]
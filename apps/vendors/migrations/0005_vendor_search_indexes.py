@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendors', '0004_vendordocument_required_docs_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(fields=['business_name'], name='vendors_busines_1c4e2b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(fields=['contact_email'], name='vendors_contact_7d93aa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(fields=['city'], name='vendors_city_5b20c7_idx'),
+        ),
+    ]
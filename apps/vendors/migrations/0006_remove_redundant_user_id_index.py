@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendors', '0005_vendor_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='vendor',
+            name='vendors_user_id_5e6fe3_idx',
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendors', '0006_remove_redundant_user_id_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='vendor',
+            name='vendors_status_079e23_idx',
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(
+                fields=['status', '-created_at'],
+                name='vendors_status_created_idx',
+            ),
+        ),
+    ]
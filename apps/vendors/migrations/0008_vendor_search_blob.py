@@ -0,0 +1,25 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendors', '0007_vendor_status_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vendor',
+            name='search_blob',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Concat(
+                    'business_name', models.Value(' '),
+                    'contact_email', models.Value(' '),
+                    'city'
+                ),
+                output_field=models.TextField(),
+            ),
+        ),
+    ]
@@ -1,7 +1,20 @@
+from django.core.cache import cache
 from django.db import models
+from django.db.models.functions import Concat
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
 
+# Version stamp for the cached public vendor listing; bumped whenever a
+# vendor row changes so stale payloads fall out of the cache immediately
+PUBLIC_VENDORS_VERSION_KEY = 'public_vendors:ver'
+
+
+def bump_public_vendors_version():
+    try:
+        cache.incr(PUBLIC_VENDORS_VERSION_KEY)
+    except ValueError:
+        cache.set(PUBLIC_VENDORS_VERSION_KEY, 1, timeout=None)
+
 
 class Vendor(models.Model):
     class VendorStatus(models.TextChoices):
@@ -20,7 +33,7 @@ class Vendor(models.Model):
     
     # Core vendor information
     user_id = models.BigIntegerField(unique=True, db_index=True)  # Reference to auth service user
-    business_name = models.CharField(max_length=255)
+    business_name = models.CharField(max_length=255, db_collation='NOCASE')
     business_slug = models.SlugField(max_length=300, unique=True)
     business_type = models.CharField(max_length=50, choices=BusinessType.choices)
     business_description = models.TextField(blank=True, null=True)
@@ -68,16 +81,46 @@ class Vendor(models.Model):
     # Review information
     reviewed_by = models.BigIntegerField(blank=True, null=True)  # Admin user ID from auth service
     rejection_reason = models.TextField(blank=True, null=True)
+
+    # Stored concatenation of the admin-searchable columns, so one LIKE
+    # predicate replaces three OR'd scans in the admin search
+    search_blob = models.GeneratedField(
+        expression=Concat(
+            'business_name', models.Value(' '),
+            'contact_email', models.Value(' '),
+            'city'
+        ),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
+
+    # Denormalized pointer to the primary payout account, maintained by
+    # PayoutAccount.save(), so payout flows avoid a per-vendor lookup
+    primary_payout_account = models.ForeignKey(
+        'payouts.PayoutAccount',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='+'
+    )
     
     class Meta:
         db_table = 'vendors'
         verbose_name = 'Vendor'
         verbose_name_plural = 'Vendors'
         indexes = [
-            models.Index(fields=['user_id']),
-            models.Index(fields=['status']),
+            # user_id needs no entry here: unique=True already builds the
+            # index the duplicate-account check probes
+            # Serves status filters combined with the default -created_at
+            # ordering on the admin and public listings without a sort step
+            models.Index(fields=['status', '-created_at'], name='vendors_status_created_idx'),
             models.Index(fields=['business_slug']),
             models.Index(fields=['created_at']),
+            # Admin search columns; with the NOCASE collation on
+            # business_name these serve case-insensitive prefix matches
+            models.Index(fields=['business_name'], name='vendors_busines_1c4e2b_idx'),
+            models.Index(fields=['contact_email'], name='vendors_contact_7d93aa_idx'),
+            models.Index(fields=['city'], name='vendors_city_5b20c7_idx'),
         ]
         ordering = ['-created_at']
     
@@ -97,6 +140,12 @@ class Vendor(models.Model):
             from django.utils.text import slugify
             self.business_slug = slugify(self.business_name)
         super().save(*args, **kwargs)
+        bump_public_vendors_version()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        bump_public_vendors_version()
+        return result
 
 
 class VendorDocument(models.Model):
@@ -128,6 +177,14 @@ class VendorDocument(models.Model):
         db_table = 'vendor_documents'
         verbose_name = 'Vendor Document'
         verbose_name_plural = 'Vendor Documents'
+        indexes = [
+            # Covers the required-documents predicate used by auto-approval
+            # and incomplete-application checks
+            models.Index(
+                fields=['vendor', 'document_type', 'is_verified'],
+                name='vendor_docu_vendor__8a41f1_idx',
+            ),
+        ]
         ordering = ['-created_at']
     
     def __str__(self):
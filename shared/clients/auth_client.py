@@ -1,73 +1,323 @@
+import hashlib
+import orjson
 import requests
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from django.conf import settings
 from django.core.cache import cache
 from rest_framework import status
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import jwt
 from jwt import PyJWTError
+import random
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from types import MappingProxyType
 
 from shared.exceptions import AuthServiceError, ExternalServiceError, handle_service_exception
 
 logger = logging.getLogger(__name__)
 
+# Settings snapshot: resolved once at import so the per-request path never
+# goes through Django's lazy settings object
+_AUTH_BASE_URL = settings.AUTH_SERVICE_URL.rstrip('/')
+_AUTH_TOKEN = getattr(settings, 'SERVICE_TOKENS', {}).get('auth_service')
+_AUTH_TIMEOUT = getattr(settings, 'EXTERNAL_SERVICE_TIMEOUT', 30)
+_AUTH_RETRIES = getattr(settings, 'EXTERNAL_SERVICE_RETRIES', 3)
+_AUTH_JWT_ALGORITHMS = getattr(settings, 'AUTH_JWT_ALGORITHMS', ['RS256'])
+_AUTH_JWT_AUDIENCE = getattr(settings, 'AUTH_JWT_AUDIENCE', None)
+
+
+def _secret_cache_key(prefix: str, secret: str) -> str:
+    """
+    Build a cache key for a token/API key without embedding the secret.
+    A 16-byte BLAKE2b digest keeps keys small (a raw JWT can run to a few
+    KB) and keeps credentials out of cache-server logs and dumps.
+    """
+    return prefix + hashlib.blake2b(secret.encode(), digest_size=16).hexdigest()
+
+
+# Negative-cache sentinels: known-bad tokens and missing users are rejected
+# locally for a short window instead of re-hitting the auth service
+_INVALID_TOKEN = {'__invalid__': True}
+_MISSING_USER = {'__missing__': True}
+
+
+def _is_negative(value) -> bool:
+    """True when a cached value is a negative-result sentinel."""
+    return isinstance(value, dict) and ('__invalid__' in value or '__missing__' in value)
+
+
+def _unwrap_profile(value):
+    """Return the profile from a stale-while-revalidate envelope, or the
+    value unchanged for entries written without one."""
+    if isinstance(value, dict) and 'fresh_until' in value:
+        return value['value']
+    return value
+
+
+class _LocalTTLCache:
+    """
+    Small thread-safe TTL+LRU map that fronts the remote cache, so the
+    hottest tokens and profiles resolve with an in-process dict hit instead
+    of a Redis round-trip. The short TTL bounds staleness relative to the
+    longer remote-cache TTLs.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: int = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class CircuitBreaker:
+    """
+    Per-process circuit breaker for an upstream service.
+
+    CLOSED passes calls through; after failure_threshold consecutive
+    failures the circuit OPENs and callers fail fast instead of waiting
+    out retries and timeouts. After a jittered recovery window a single
+    HALF_OPEN probe decides whether to close again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    _instances: Dict[str, 'CircuitBreaker'] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_upstream(cls, key: str, failure_threshold: int = 5,
+                     recovery_timeout: int = 30) -> 'CircuitBreaker':
+        """
+        Return the breaker shared by every client of the given upstream,
+        creating it on first use.
+        """
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(failure_threshold, recovery_timeout)
+            return cls._instances[key]
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 30):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._recovery_window = recovery_timeout
+        self._lock = threading.Lock()
+
+    def before_call(self, service_name: str = 'upstream'):
+        """
+        Raise immediately when the circuit is open; let one probe through
+        once the recovery window has elapsed.
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at >= self._recovery_window:
+                    self.state = self.HALF_OPEN
+                else:
+                    raise ExternalServiceError(
+                        service_name,
+                        "circuit open, failing fast",
+                        status.HTTP_503_SERVICE_UNAVAILABLE
+                    )
+            elif self.state == self.HALF_OPEN:
+                # A probe is already in flight; everyone else fails fast
+                raise ExternalServiceError(
+                    service_name,
+                    "circuit half-open, probe in flight",
+                    status.HTTP_503_SERVICE_UNAVAILABLE
+                )
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                # Jitter the window so many processes don't close in lockstep
+                self._recovery_window = self.recovery_timeout + random.uniform(
+                    0, self.recovery_timeout * 0.2
+                )
+
 
 class AuthClient:
     """
     Client for communicating with the Auth Service microservice.
     Handles user authentication, authorization, and profile management.
     """
-    
+
+    # No __dict__ per instance; also keeps attribute access a fixed-slot
+    # load on the per-request path
+    __slots__ = (
+        'base_url', 'service_token', 'timeout', 'retry_attempts',
+        'base_delay', 'max_backoff', 'session', '_default_headers',
+        '_breaker', 'jwt_algorithms', 'jwt_audience', '_inflight',
+        '_inflight_lock', '_local', '_url_cache', '_refresh_executor',
+        '_refreshing', '_refreshing_lock',
+    )
+
     def __init__(self):
-        self.base_url = settings.AUTH_SERVICE_URL.rstrip('/')
-        self.service_token = getattr(settings, 'SERVICE_TOKENS', {}).get('auth_service')
-        self.timeout = getattr(settings, 'EXTERNAL_SERVICE_TIMEOUT', 30)
-        self.retry_attempts = getattr(settings, 'EXTERNAL_SERVICE_RETRIES', 3)
-    
-    def _get_headers(self, additional_headers: Dict[str, str] = None) -> Dict[str, str]:
-        """
-        Get default headers for auth service requests.
-        """
-        headers = {
+        self.base_url = _AUTH_BASE_URL
+        self.service_token = _AUTH_TOKEN
+        self.timeout = _AUTH_TIMEOUT
+        self.retry_attempts = _AUTH_RETRIES
+        # Full-jitter backoff bounds; jitter stops every pod retrying on the
+        # same deterministic schedule when the auth service flaps
+        self.base_delay = 0.1
+        self.max_backoff = 30
+        # Reuse one session so keep-alive sockets (and their TLS handshakes)
+        # are shared across requests instead of reconnecting per call
+        self.session = requests.Session()
+        self.session.mount(self.base_url, HTTPAdapter(
+            pool_connections=32, pool_maxsize=64, max_retries=0
+        ))
+        # Default headers never change per call; build them once, freeze
+        # them, and set them on the session instead of rebuilding the dict
+        # for every request
+        default_headers = {
             'Content-Type': 'application/json',
             'User-Agent': 'VendorService/1.0',
         }
-        
-        # Add service token for internal service communication
         if self.service_token:
-            headers['X-Service-Token'] = self.service_token
-        
-        # Add additional headers if provided
-        if additional_headers:
-            headers.update(additional_headers)
-        
-        return headers
+            default_headers['X-Service-Token'] = self.service_token
+        self._default_headers = MappingProxyType(default_headers)
+        self.session.headers.update(self._default_headers)
+        # Shared per base_url, so every client instance in the process sees
+        # the same open/closed state
+        self._breaker = CircuitBreaker.for_upstream(self.base_url)
+        # Local JWT verification settings; tokens signed by the auth service
+        # can be checked against its published keys without a round trip
+        self.jwt_algorithms = _AUTH_JWT_ALGORITHMS
+        self.jwt_audience = _AUTH_JWT_AUDIENCE
+        # In-flight batch fetches keyed by the requested ID set, so
+        # concurrent threads missing the same users share one response
+        self._inflight: Dict[frozenset, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # In-process front tier for the hottest tokens/profiles
+        self._local = _LocalTTLCache()
+        # Endpoint -> full URL memo; fixed endpoints dominate, so repeat
+        # calls skip the f-string/lstrip work
+        self._url_cache: Dict[str, str] = {}
+        # Stale-while-revalidate plumbing: background refreshes run here,
+        # with at most one in flight per user_id
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='auth-swr'
+        )
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+
+    def close(self):
+        """
+        Dispose of the pooled session and its sockets. Call from a
+        process-fork hook (gunicorn post_fork / uwsgi @postfork) before
+        reinitializing, so workers never share TCP connections inherited
+        from the parent process.
+        """
+        self.session.close()
+
+    def _get_headers(self, additional_headers: Dict[str, str] = None) -> Dict[str, str]:
+        """
+        Get default headers for auth service requests, merging in any
+        call-specific extras. Only allocates when extras are supplied.
+        """
+        if not additional_headers:
+            return self._default_headers
+        return {**self._default_headers, **additional_headers}
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Full-jitter exponential backoff: a uniform draw over the capped
+        exponential window spreads retries out instead of synchronizing
+        them across processes.
+        """
+        return random.uniform(0, min(self.max_backoff, self.base_delay * (2 ** attempt)))
+
+    def _make_request(self, method: str, endpoint: str,
+                      idempotent: bool = None, **kwargs) -> requests.Response:
         """
         Make HTTP request to auth service with error handling and retry logic.
+
+        Retries are only safe when replaying the request can't duplicate a
+        write, so non-idempotent methods get a single attempt unless the
+        caller supplies an Idempotency-Key header (or passes idempotent=True
+        explicitly) to let the server dedup.
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        
-        # Ensure headers are set
-        if 'headers' not in kwargs:
-            kwargs['headers'] = self._get_headers()
-        else:
+        if idempotent is None:
+            idempotent = (
+                method.upper() in ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+                or 'Idempotency-Key' in (kwargs.get('headers') or {})
+            )
+        attempts = self.retry_attempts if idempotent else 1
+
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache.setdefault(
+                endpoint, f"{self.base_url}/{endpoint.lstrip('/')}"
+            )
+
+        # Defaults ride on the session; only merge when a caller adds extras
+        if 'headers' in kwargs:
             kwargs['headers'] = self._get_headers(kwargs['headers'])
-        
+
+        # Encode request bodies with orjson rather than stdlib json; the
+        # session's Content-Type default already marks them as JSON
+        if 'json' in kwargs:
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
+
         # Set timeout
         if 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
         
+        # Fail fast while the auth service is known to be down, instead of
+        # burning a full timeout-and-retry cycle per caller
+        self._breaker.before_call('Auth')
+
         last_exception = None
-        
-        for attempt in range(self.retry_attempts):
+
+        for attempt in range(attempts):
             try:
                 logger.debug(f"Auth service request: {method} {url} (attempt {attempt + 1})")
-                
-                response = requests.request(method, url, **kwargs)
-                
+
+                response = self.session.request(method, url, **kwargs)
+
+                # Any response below 5xx means the service itself is healthy
+                if response.status_code >= 500:
+                    self._breaker.record_failure()
+                else:
+                    self._breaker.record_success()
+
                 # If successful, return response
                 if response.status_code < 400:
                     return response
@@ -80,32 +330,43 @@ class AuthClient:
                 elif response.status_code == 404:
                     raise AuthServiceError("Resource not found", status.HTTP_404_NOT_FOUND)
                 elif response.status_code == 429:
-                    # Rate limiting - wait and retry
+                    # Rate limiting - wait and retry, with jitter so callers
+                    # don't all come back at the same instant
                     retry_after = int(response.headers.get('Retry-After', 5))
-                    time.sleep(retry_after)
+                    time.sleep(retry_after + random.uniform(0, retry_after * 0.2))
                     continue
                 else:
-                    # For other errors, try to extract error message
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get('error', {}).get('message', 'Unknown error')
-                    except:
-                        error_msg = response.text or 'Unknown error'
-                    
+                    # For other errors, try to extract error message; only
+                    # decode reasonably sized bodies, and never let a parse
+                    # failure mask the original HTTP error
+                    error_msg = 'Unknown error'
+                    if len(response.content) <= 4096:
+                        try:
+                            error_data = orjson.loads(response.content)
+                            error_msg = (
+                                (error_data.get('error') or {}).get('message')
+                                or error_data.get('detail')
+                                or 'Unknown error'
+                            )
+                        except (ValueError, orjson.JSONDecodeError, AttributeError):
+                            error_msg = response.text[:512] if response.content else 'Unknown error'
+
                     raise AuthServiceError(f"HTTP {response.status_code}: {error_msg}", response.status_code)
             
             except requests.Timeout as e:
                 last_exception = e
+                self._breaker.record_failure()
                 logger.warning(f"Auth service timeout on attempt {attempt + 1}: {str(e)}")
-                if attempt < self.retry_attempts - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                if attempt < attempts - 1:
+                    time.sleep(self._backoff_delay(attempt))  # Full-jitter backoff
                     continue
             
             except requests.ConnectionError as e:
                 last_exception = e
+                self._breaker.record_failure()
                 logger.error(f"Auth service connection error on attempt {attempt + 1}: {str(e)}")
-                if attempt < self.retry_attempts - 1:
-                    time.sleep(2 ** attempt)
+                if attempt < attempts - 1:
+                    time.sleep(self._backoff_delay(attempt))
                     continue
             
             except AuthServiceError as e:
@@ -115,8 +376,8 @@ class AuthClient:
             except Exception as e:
                 last_exception = e
                 logger.error(f"Unexpected error contacting auth service on attempt {attempt + 1}: {str(e)}")
-                if attempt < self.retry_attempts - 1:
-                    time.sleep(2 ** attempt)
+                if attempt < attempts - 1:
+                    time.sleep(self._backoff_delay(attempt))
                     continue
         
         # If we've exhausted all retry attempts
@@ -125,6 +386,70 @@ class AuthClient:
         else:
             raise AuthServiceError("Failed to connect to auth service after multiple attempts")
     
+    def _get_jwks(self) -> Dict[str, Any]:
+        """
+        Get the auth service's published signing keys, cached for 15 minutes.
+
+        Returns:
+            Dict containing the JWKS document
+        """
+        jwks = cache.get('auth_jwks')
+        if jwks is None:
+            response = self._make_request('GET', '/api/auth/.well-known/jwks.json')
+            jwks = orjson.loads(response.content)
+            cache.set('auth_jwks', jwks, 900)
+        return jwks
+
+    def _decode_token_locally(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify a JWT's signature and expiry against the cached JWKS, without
+        a network round trip.
+
+        Args:
+            token: Token to verify
+
+        Returns:
+            Dict of claims when locally verified, or None when the token is
+            opaque or local verification is inconclusive (unknown kid, JWKS
+            unavailable) and the remote endpoint should decide
+
+        Raises:
+            AuthServiceError: If the token is definitively invalid
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except PyJWTError:
+            # Opaque token; needs remote introspection
+            return None
+
+        try:
+            keys = {key.get('kid'): key for key in self._get_jwks().get('keys', [])}
+            jwk = keys.get(header.get('kid'))
+            if jwk is None:
+                return None
+            return jwt.decode(
+                token,
+                jwt.PyJWK(jwk).key,
+                algorithms=self.jwt_algorithms,
+                audience=self.jwt_audience,
+                leeway=30,
+                options={
+                    'require': ['exp'],
+                    'verify_aud': self.jwt_audience is not None,
+                },
+            )
+        except (jwt.ExpiredSignatureError, jwt.InvalidSignatureError) as e:
+            raise AuthServiceError(
+                f"Token validation failed: {str(e)}",
+                status.HTTP_401_UNAUTHORIZED
+            )
+        except PyJWTError:
+            # Inconclusive locally; let the auth service decide
+            return None
+        except Exception as e:
+            logger.warning(f"Local JWT verification unavailable, falling back to auth service: {str(e)}")
+            return None
+
     def validate_token(self, token: str) -> Dict[str, Any]:
         """
         Validate JWT token with auth service.
@@ -138,30 +463,86 @@ class AuthClient:
         Raises:
             AuthServiceError: If token is invalid or validation fails
         """
-        cache_key = f"auth_token_{token}"
-        
-        # Check cache first
+        cache_key = _secret_cache_key('auth_tok_', token)
+
+        # Hottest tokens resolve in-process without a Redis round-trip
+        local_result = self._local.get(cache_key)
+        if local_result is not None:
+            return local_result
+
+        # Check cache first; a negative hit means this exact token was
+        # recently rejected and can be refused without any network work
         cached_result = cache.get(cache_key)
         if cached_result:
+            if _is_negative(cached_result):
+                raise AuthServiceError(
+                    "Token validation failed: token recently rejected",
+                    status.HTTP_401_UNAUTHORIZED
+                )
+            self._local.set(cache_key, cached_result)
             return cached_result
-        
+
+        # Self-describing JWTs verify locally against the cached JWKS,
+        # skipping the auth-service round trip entirely
+        claims = self._decode_token_locally(token)
+        if claims is not None:
+            cache.set(cache_key, claims, 300)
+            self._local.set(cache_key, claims)
+            return claims
+
+        # Single-flight: a burst of requests with the same fresh token would
+        # otherwise all stampede the auth service with identical calls. Only
+        # the caller that wins the lock validates; the rest poll the cache
+        # until the winner fills it.
+        lock_key = f"lock:{cache_key}"
+        owns_lock = cache.add(lock_key, 1, timeout=10)
+
+        if not owns_lock:
+            deadline = time.monotonic() + 3.0
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                cached_result = cache.get(cache_key)
+                if cached_result:
+                    # The winner may have negative-cached a rejection;
+                    # surface it the same way the direct cache read does
+                    if _is_negative(cached_result):
+                        raise AuthServiceError(
+                            "Token validation failed: token recently rejected",
+                            status.HTTP_401_UNAUTHORIZED
+                        )
+                    self._local.set(cache_key, cached_result)
+                    return cached_result
+            # Lock holder is slow or died; validate ourselves rather than
+            # failing the request
+
         try:
             response = self._make_request(
                 'POST',
                 '/api/auth/validate-token/',
                 json={'token': token}
             )
-            
-            user_data = response.json()
-            
+
+            user_data = orjson.loads(response.content)
+
             # Cache successful validation for 5 minutes
             cache.set(cache_key, user_data, 300)
-            
+            self._local.set(cache_key, user_data)
+
             return user_data
-            
+
+        except AuthServiceError as e:
+            if e.status_code == status.HTTP_401_UNAUTHORIZED:
+                # Negative-cache the rejection briefly so a replayed bad
+                # token doesn't re-hit the auth service on every attempt
+                cache.set(cache_key, _INVALID_TOKEN, 30)
+            logger.error(f"Token validation failed: {str(e)}")
+            raise
         except Exception as e:
             logger.error(f"Token validation failed: {str(e)}")
             raise AuthServiceError(f"Token validation failed: {str(e)}")
+        finally:
+            if owns_lock:
+                cache.delete(lock_key)
     
     def get_user_profile(self, user_id: int) -> Dict[str, Any]:
         """
@@ -174,24 +555,90 @@ class AuthClient:
             Dict containing user profile information
         """
         cache_key = f"user_profile_{user_id}"
-        
-        # Check cache first
+
+        # Hottest profiles resolve in-process without a Redis round-trip
+        local_profile = self._local.get(cache_key)
+        if local_profile is not None:
+            return local_profile
+
+        # Check cache first; a negative hit means the user was recently
+        # looked up and doesn't exist
         cached_profile = cache.get(cache_key)
         if cached_profile:
-            return cached_profile
-        
+            if _is_negative(cached_profile):
+                raise AuthServiceError(
+                    f"User {user_id} not found", status.HTTP_404_NOT_FOUND
+                )
+
+            if isinstance(cached_profile, dict) and 'fresh_until' in cached_profile:
+                now = time.time()
+                profile = cached_profile['value']
+                if now < cached_profile['fresh_until']:
+                    self._local.set(cache_key, profile)
+                    return profile
+                if now < cached_profile['stale_until']:
+                    # Serve stale and refresh in the background, so the
+                    # cache boundary never blocks request latency on the
+                    # auth service
+                    with self._refreshing_lock:
+                        should_refresh = user_id not in self._refreshing
+                        if should_refresh:
+                            self._refreshing.add(user_id)
+                    if should_refresh:
+                        self._refresh_executor.submit(
+                            self._refresh_profile, user_id, cache_key
+                        )
+                    return profile
+            else:
+                # Entry written before SWR envelopes (e.g. by the batch
+                # paths); serve as-is
+                self._local.set(cache_key, cached_profile)
+                return cached_profile
+
         try:
             response = self._make_request('GET', f'/api/users/{user_id}/')
-            profile_data = response.json()
-            
-            # Cache user profile for 10 minutes
-            cache.set(cache_key, profile_data, 600)
-            
+            profile_data = orjson.loads(response.content)
+
+            self._store_profile(cache_key, profile_data)
+
             return profile_data
-            
+
+        except AuthServiceError as e:
+            if e.status_code == status.HTTP_404_NOT_FOUND:
+                # Negative-cache missing users for a minute
+                cache.set(cache_key, _MISSING_USER, 60)
+            logger.error(f"Failed to get user profile for user {user_id}: {str(e)}")
+            raise
         except Exception as e:
             logger.error(f"Failed to get user profile for user {user_id}: {str(e)}")
             raise AuthServiceError(f"Failed to get user profile: {str(e)}")
+
+    def _store_profile(self, cache_key: str, profile_data: Dict[str, Any]):
+        """
+        Write a profile to both cache tiers in a stale-while-revalidate
+        envelope: fresh for 10 minutes, servable-stale for 5 more.
+        """
+        now = time.time()
+        cache.set(cache_key, {
+            'value': profile_data,
+            'fresh_until': now + 600,
+            'stale_until': now + 900,
+        }, 900)
+        self._local.set(cache_key, profile_data)
+
+    def _refresh_profile(self, user_id: int, cache_key: str):
+        """
+        Background revalidation for a stale profile. Failures are logged
+        and the stale entry keeps serving until its window closes.
+        """
+        try:
+            response = self._make_request('GET', f'/api/users/{user_id}/')
+            self._store_profile(cache_key, orjson.loads(response.content))
+        except Exception as e:
+            logger.warning(f"Background profile refresh failed for user {user_id}: {str(e)}")
+        finally:
+            with self._refreshing_lock:
+                self._refreshing.discard(user_id)
     
     def update_user_profile(self, user_id: int, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -211,7 +658,7 @@ class AuthClient:
                 json=update_data
             )
             
-            updated_profile = response.json()
+            updated_profile = orjson.loads(response.content)
             
             # Invalidate cache
             cache.delete(f"user_profile_{user_id}")
@@ -222,6 +669,38 @@ class AuthClient:
             logger.error(f"Failed to update user profile for user {user_id}: {str(e)}")
             raise AuthServiceError(f"Failed to update user profile: {str(e)}")
     
+    def bulk_update_users(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Update multiple user profiles in a single request.
+
+        Args:
+            updates: List of dicts, each containing a 'user_id' plus the
+                fields to update for that user
+
+        Returns:
+            Dict containing per-user success/failure results
+        """
+        try:
+            response = self._make_request(
+                'POST',
+                '/api/users/bulk-update/',
+                json={'updates': updates}
+            )
+
+            result = orjson.loads(response.content)
+
+            # Invalidate cached profiles for the updated users
+            cache.delete_many([
+                f"user_profile_{update['user_id']}"
+                for update in updates if 'user_id' in update
+            ])
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to bulk update users: {str(e)}")
+            raise AuthServiceError(f"Failed to bulk update users: {str(e)}")
+
     def update_user_role(self, user_id: int, user_type: str) -> Dict[str, Any]:
         """
         Update user role/type in auth service.
@@ -240,7 +719,7 @@ class AuthClient:
                 json={'user_type': user_type}
             )
             
-            updated_profile = response.json()
+            updated_profile = orjson.loads(response.content)
             
             # Invalidate cache
             cache.delete(f"user_profile_{user_id}")
@@ -251,6 +730,33 @@ class AuthClient:
             logger.error(f"Failed to update user role for user {user_id}: {str(e)}")
             raise AuthServiceError(f"Failed to update user role: {str(e)}")
     
+    def _fetch_profiles_concurrently(self, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetch user profiles one-by-one but in parallel over the pooled
+        session, so N misses cost roughly one RTT instead of N. Used as the
+        fallback when the batch endpoint is unavailable.
+
+        Args:
+            user_ids: List of user IDs to fetch
+
+        Returns:
+            Dict mapping user_id to user profile (failures are omitted)
+        """
+        profiles = {}
+
+        def fetch(user_id):
+            try:
+                return user_id, self.get_user_profile(user_id)
+            except AuthServiceError:
+                return user_id, None
+
+        with ThreadPoolExecutor(max_workers=min(32, len(user_ids))) as executor:
+            for user_id, profile in executor.map(fetch, user_ids):
+                if profile is not None:
+                    profiles[user_id] = profile
+
+        return profiles
+
     def get_users_batch(self, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
         """
         Get multiple user profiles in batch.
@@ -263,44 +769,104 @@ class AuthClient:
         """
         if not user_ids:
             return {}
-        
-        # Check cache first
-        cached_users = {}
-        missing_ids = []
-        
-        for user_id in user_ids:
-            cache_key = f"user_profile_{user_id}"
-            cached_profile = cache.get(cache_key)
-            if cached_profile:
-                cached_users[user_id] = cached_profile
-            else:
-                missing_ids.append(user_id)
-        
+
+        # One pipelined MGET instead of a cache round-trip per user;
+        # negative hits are known-missing users and are simply omitted
+        keys = [f"user_profile_{user_id}" for user_id in user_ids]
+        key_to_uid = dict(zip(keys, user_ids))
+        hits = cache.get_many(keys)
+        cached_users = {
+            key_to_uid[key]: _unwrap_profile(profile)
+            for key, profile in hits.items() if not _is_negative(profile)
+        }
+        missing_ids = [
+            uid for uid in user_ids
+            if uid not in cached_users and f"user_profile_{uid}" not in hits
+        ]
+
         # If all users are cached, return them
         if not missing_ids:
             return cached_users
-        
+
+        # Coalesce concurrent misses on the same ID set: the first thread
+        # does the fetch, the rest wait on its Future instead of issuing
+        # duplicate batch requests
+        inflight_key = frozenset(missing_ids)
+        with self._inflight_lock:
+            future = self._inflight.get(inflight_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[inflight_key] = future
+
+        if is_leader:
+            try:
+                future.set_result(self._fetch_users_batch(missing_ids))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(inflight_key, None)
+
         try:
-            response = self._make_request(
-                'POST',
-                '/api/users/batch/',
-                json={'user_ids': missing_ids}
-            )
-            
-            batch_users = response.json()
-            
-            # Cache the new users and combine with cached ones
-            for user_id, user_data in batch_users.items():
-                cache_key = f"user_profile_{user_id}"
-                cache.set(cache_key, user_data, 600)
-                cached_users[int(user_id)] = user_data
-            
+            cached_users.update(future.result(timeout=self.timeout))
             return cached_users
-            
+
         except Exception as e:
-            logger.error(f"Failed to get batch users: {str(e)}")
-            # Return whatever we have from cache
+            logger.error(f"Failed to get batch users, falling back to parallel single fetches: {str(e)}")
+            # Batch endpoint unavailable: fan the misses out concurrently
+            # rather than dropping them
+            cached_users.update(self._fetch_profiles_concurrently(missing_ids))
             return cached_users
+
+    def _fetch_users_batch(self, missing_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetch the given profiles from the batch endpoint and cache them.
+
+        Args:
+            missing_ids: User IDs not found in cache
+
+        Returns:
+            Dict mapping user_id to user profile
+        """
+        response = self._make_request(
+            'POST',
+            '/api/users/batch/',
+            json={'user_ids': missing_ids},
+            headers={'Accept': 'application/x-ndjson'},
+            stream=True
+        )
+
+        if 'ndjson' in response.headers.get('Content-Type', ''):
+            # Stream-parse one profile per line, caching in bounded chunks,
+            # so a large batch never sits in memory as one parsed blob
+            users = {}
+            pending = {}
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                profile = orjson.loads(line)
+                user_id = int(profile['id'])
+                users[user_id] = profile
+                pending[f"user_profile_{user_id}"] = profile
+                if len(pending) >= 100:
+                    cache.set_many(pending, 600)
+                    pending = {}
+            if pending:
+                cache.set_many(pending, 600)
+            return users
+
+        # Plain JSON mapping from servers that don't speak ndjson
+        batch_users = orjson.loads(response.content)
+
+        # Cache the new users in one write
+        cache.set_many(
+            {f"user_profile_{user_id}": user_data
+             for user_id, user_data in batch_users.items()},
+            600
+        )
+
+        return {int(user_id): user_data for user_id, user_data in batch_users.items()}
     
     def verify_user_permission(self, user_id: int, permission: str, resource: str = None) -> bool:
         """
@@ -314,6 +880,16 @@ class AuthClient:
         Returns:
             Boolean indicating if user has permission
         """
+        # Permission checks repeat heavily within a session; a short TTL
+        # turns almost all of them into cache hits. False is a valid cached
+        # value, so test against None.
+        cache_key = _secret_cache_key(
+            f"perm_{user_id}_", f"{permission}|{resource or ''}"
+        )
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         try:
             payload = {
                 'user_id': user_id,
@@ -321,20 +897,94 @@ class AuthClient:
             }
             if resource:
                 payload['resource'] = resource
-            
+
             response = self._make_request(
                 'POST',
                 '/api/auth/verify-permission/',
                 json=payload
             )
-            
-            result = response.json()
-            return result.get('has_permission', False)
-            
+
+            result = orjson.loads(response.content).get('has_permission', False)
+            cache.set(
+                cache_key,
+                result,
+                getattr(self, 'cache_ttl', {}).get('permission_check', 300)
+            )
+            return result
+
         except Exception as e:
             logger.error(f"Failed to verify permission for user {user_id}: {str(e)}")
             return False
     
+    def verify_user_permissions(self, user_id: int,
+                                permissions: List[Tuple[str, Optional[str]]]) -> Dict[Tuple[str, Optional[str]], bool]:
+        """
+        Verify multiple permissions for a user in a single request.
+
+        Args:
+            user_id: ID of the user
+            permissions: List of (permission, resource) tuples; resource
+                may be None
+
+        Returns:
+            Dict mapping each (permission, resource) tuple to a boolean
+        """
+        if not permissions:
+            return {}
+
+        results = {}
+        missing = []
+
+        # Consult the per-check cache first so only uncached checks travel
+        for permission, resource in permissions:
+            cache_key = _secret_cache_key(
+                f"perm_{user_id}_", f"{permission}|{resource or ''}"
+            )
+            cached_result = cache.get(cache_key)
+            if cached_result is not None:
+                results[(permission, resource)] = cached_result
+            else:
+                missing.append((permission, resource))
+
+        if not missing:
+            return results
+
+        try:
+            response = self._make_request(
+                'POST',
+                '/api/auth/verify-permissions/',
+                json={
+                    'user_id': user_id,
+                    'checks': [
+                        {'permission': permission, 'resource': resource}
+                        for permission, resource in missing
+                    ]
+                }
+            )
+
+            # Results come back aligned by index with the checks we sent
+            ttl = getattr(self, 'cache_ttl', {}).get('permission_check', 300)
+            for (permission, resource), allowed in zip(
+                missing, orjson.loads(response.content).get('results', [])
+            ):
+                allowed = bool(allowed)
+                cache.set(
+                    _secret_cache_key(
+                        f"perm_{user_id}_", f"{permission}|{resource or ''}"
+                    ),
+                    allowed,
+                    ttl
+                )
+                results[(permission, resource)] = allowed
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to verify permissions for user {user_id}: {str(e)}")
+            for check in missing:
+                results.setdefault(check, False)
+            return results
+
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new user in auth service.
@@ -347,13 +997,17 @@ class AuthClient:
             Dict containing created user information
         """
         try:
+            # A per-operation idempotency key lets the server dedup, which
+            # makes retrying this POST safe if only the response was lost
             response = self._make_request(
                 'POST',
                 '/api/auth/register/',
-                json=user_data
+                json=user_data,
+                headers={'Idempotency-Key': str(uuid.uuid4())},
+                idempotent=True
             )
-            
-            return response.json()
+
+            return orjson.loads(response.content)
             
         except Exception as e:
             logger.error(f"Failed to create user: {str(e)}")
@@ -399,15 +1053,28 @@ class AuthClient:
         Returns:
             List of user profiles matching the search
         """
+        # Typeahead traffic repeats the same few queries constantly; cache
+        # on the normalized query so casing/whitespace variants share hits.
+        # Longer queries change less often and get a longer TTL.
+        normalized = query.lower().strip()
+        cache_key = _secret_cache_key(
+            'usr_search_', f"{normalized}|{user_type}|{limit}"
+        )
+        cached_results = cache.get(cache_key)
+        if cached_results is not None:
+            return cached_results
+
         try:
-            params = {'search': query, 'limit': limit}
+            params = {'search': normalized, 'limit': limit}
             if user_type:
                 params['user_type'] = user_type
-            
+
             response = self._make_request('GET', '/api/users/search/', params=params)
-            
-            return response.json().get('results', [])
-            
+
+            results = orjson.loads(response.content).get('results', [])
+            cache.set(cache_key, results, 60 if len(normalized) > 3 else 15)
+            return results
+
         except Exception as e:
             logger.error(f"Failed to search users: {str(e)}")
             return []
@@ -428,7 +1095,7 @@ class AuthClient:
         
         try:
             response = self._make_request('GET', '/api/auth/stats/')
-            stats = response.json()
+            stats = orjson.loads(response.content)
             
             # Cache stats for 15 minutes
             cache.set(cache_key, stats, 900)
@@ -457,7 +1124,7 @@ class AuthClient:
                 headers=self._get_headers({'X-API-Key': api_key})
             )
             
-            return response.json()
+            return orjson.loads(response.content)
             
         except Exception as e:
             logger.error(f"API key validation failed: {str(e)}")
@@ -468,7 +1135,9 @@ class CachedAuthClient(AuthClient):
     """
     Extended auth client with enhanced caching capabilities.
     """
-    
+
+    __slots__ = ('cache_ttl',)
+
     def __init__(self):
         super().__init__()
         self.cache_ttl = {
@@ -516,38 +1185,55 @@ class CachedAuthClient(AuthClient):
         
         result = {}
         missing_ids = []
-        
+
         if not force_refresh:
-            for user_id in user_ids:
-                cache_key = f"user_profile_{user_id}"
-                cached_profile = cache.get(cache_key)
-                if cached_profile:
-                    result[user_id] = cached_profile
-                else:
-                    missing_ids.append(user_id)
+            keys = [f"user_profile_{user_id}" for user_id in user_ids]
+            key_to_uid = dict(zip(keys, user_ids))
+            hits = cache.get_many(keys)
+            result = {
+                key_to_uid[key]: _unwrap_profile(profile)
+                for key, profile in hits.items() if not _is_negative(profile)
+            }
+            missing_ids = [
+                uid for uid in user_ids
+                if uid not in result and f"user_profile_{uid}" not in hits
+            ]
         else:
             missing_ids = user_ids
-        
+
         if missing_ids:
             try:
                 batch_profiles = self.get_users_batch(missing_ids)
                 result.update(batch_profiles)
-                
-                # Cache the newly fetched profiles
-                for user_id, profile in batch_profiles.items():
-                    cache_key = f"user_profile_{user_id}"
-                    cache.set(cache_key, profile, self.cache_ttl['user_profile'])
-                    
+
+                # Cache the newly fetched profiles in one write
+                cache.set_many(
+                    {f"user_profile_{user_id}": profile
+                     for user_id, profile in batch_profiles.items()},
+                    self.cache_ttl['user_profile']
+                )
+
             except Exception as e:
                 logger.error(f"Failed to get batch user profiles: {str(e)}")
-        
+
         return result
 
 
-# Singleton instance for easy access
+# Singleton instance for easy access; the session inside is thread-safe,
+# so one pooled client serves the whole worker process
 auth_client = CachedAuthClient()
 
 
+def reset_auth_client():
+    """
+    Recreate the shared client's connection pool. Wire this into the WSGI
+    server's fork hook (gunicorn post_fork, uwsgi @postfork) so each worker
+    gets fresh sockets instead of ones inherited across fork().
+    """
+    auth_client.close()
+    auth_client.__init__()
+
+
 # Utility functions for common auth operations
 def get_current_user(request) -> Dict[str, Any]:
     """
@@ -580,18 +1266,24 @@ def get_current_user(request) -> Dict[str, Any]:
     return None
 
 
-def has_permission(user_id: int, permission: str, resource: str = None) -> bool:
+def has_permission(user_id: int, permission, resource: str = None) -> bool:
     """
-    Check if user has specific permission.
-    
+    Check if user has specific permission(s).
+
     Args:
         user_id: ID of the user
-        permission: Permission to check
+        permission: Permission to check, or a list of permissions that are
+            all required (checked in one batched request)
         resource: Optional resource for context
-        
+
     Returns:
-        Boolean indicating if user has permission
+        Boolean indicating if user has the permission(s)
     """
+    if isinstance(permission, (list, tuple)):
+        results = auth_client.verify_user_permissions(
+            user_id, [(perm, resource) for perm in permission]
+        )
+        return all(results.get((perm, resource), False) for perm in permission)
     return auth_client.verify_user_permission(user_id, permission, resource)
 
 
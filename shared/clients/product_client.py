@@ -1,127 +1,305 @@
+import hashlib
+import orjson
 import requests
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.conf import settings
 from django.core.cache import cache
+from django_redis import get_redis_connection
 from rest_framework import status
 from typing import Optional, Dict, Any, List
 import time
+from types import MappingProxyType
 
 from shared.exceptions import ProductServiceError, ExternalServiceError, handle_service_exception
 
 logger = logging.getLogger(__name__)
 
 
+def _params_cache_key(prefix: str, vendor_id: int, params: str) -> str:
+    """
+    Fixed-width cache key for parameterized lookups: a short namespace for
+    debuggability plus a BLAKE2b digest of the variable portion, so keys
+    stay small however long the filter values get.
+    """
+    digest = hashlib.blake2b(params.encode(), digest_size=12).hexdigest()
+    return f"{prefix}:{vendor_id}:{digest}"
+
+
+def _unwrap_swr(value):
+    """Return the value from a (value, soft_expiry) stale-while-revalidate
+    envelope, or the value unchanged for entries written without one."""
+    if isinstance(value, tuple) and len(value) == 2:
+        return value[0]
+    return value
+
+
 class ProductClient:
     """
     Client for communicating with the Product Service microservice.
     Handles product-related operations for vendors.
     """
     
+    # Message/status pairs for the well-known client errors, looked up in
+    # one dict probe instead of walking an if/elif ladder per response
+    _STATUS_HANDLERS = {
+        401: ('Authentication failed', status.HTTP_401_UNAUTHORIZED),
+        403: ('Access forbidden', status.HTTP_403_FORBIDDEN),
+        404: ('Resource not found', status.HTTP_404_NOT_FOUND),
+    }
+
     def __init__(self):
         self.base_url = settings.PRODUCT_SERVICE_URL.rstrip('/')
         self.service_token = getattr(settings, 'SERVICE_TOKENS', {}).get('product_service')
         self.timeout = getattr(settings, 'EXTERNAL_SERVICE_TIMEOUT', 30)
         self.retry_attempts = getattr(settings, 'EXTERNAL_SERVICE_RETRIES', 3)
-    
-    def _get_headers(self, additional_headers: Dict[str, str] = None) -> Dict[str, str]:
-        """
-        Get default headers for product service requests.
-        """
-        headers = {
+        # Reuse one session so keep-alive sockets (and their TLS handshakes)
+        # are shared across requests instead of reconnecting per call.
+        # Retries live in urllib3: jittered backoff, Retry-After compliance
+        # and 429/5xx handling all happen inside the pool, restricted to
+        # idempotent methods so POSTs are never replayed.
+        retry_policy = Retry(
+            total=self.retry_attempts,
+            backoff_factor=0.1,
+            backoff_jitter=0.25,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE']),
+            respect_retry_after_header=True,
+        )
+        self.session = requests.Session()
+        self.session.mount(self.base_url, HTTPAdapter(
+            pool_connections=16, pool_maxsize=64, max_retries=retry_policy
+        ))
+        # Default headers never change per call; build them once, freeze
+        # them, and set them on the session instead of rebuilding the dict
+        # for every request
+        default_headers = {
             'Content-Type': 'application/json',
             'User-Agent': 'VendorService/1.0',
         }
-        
-        # Add service token for internal service communication
         if self.service_token:
-            headers['X-Service-Token'] = self.service_token
-        
-        # Add additional headers if provided
-        if additional_headers:
-            headers.update(additional_headers)
-        
-        return headers
-    
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+            default_headers['X-Service-Token'] = self.service_token
+        self._default_headers = MappingProxyType(default_headers)
+        self.session.headers.update(self._default_headers)
+        # Background refreshes for stale-while-revalidate reads
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='product-swr'
+        )
+        # In-flight fetches keyed by cache key, so concurrent cold-cache
+        # callers share one upstream call instead of stampeding
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Prebuilt absolute URL templates for the hot read endpoints;
+        # %-formatting one int per call beats rebuilding the f-string
+        # path and re-joining it with base_url every time
+        self._products_url = self.base_url + '/api/vendors/%d/products/'
+        self._product_count_url = self.base_url + '/api/vendors/%d/products/count/'
+        self._product_stats_url = self.base_url + '/api/vendors/%d/products/stats/'
+        self._product_analytics_url = self.base_url + '/api/vendors/%d/analytics/products/'
+
+    def _cache_set(self, vendor_id: int, key: str, value, ttl: int):
         """
-        Make HTTP request to product service with error handling and retry logic.
+        cache.set plus membership in the vendor's key index, so
+        invalidation can delete exactly what was written for that vendor
+        instead of SCANning the keyspace.
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        
-        # Ensure headers are set
-        if 'headers' not in kwargs:
-            kwargs['headers'] = self._get_headers()
+        cache.set(key, value, ttl)
+        try:
+            get_redis_connection('default').sadd(f"vendor_keys_{vendor_id}", key)
+        except Exception as e:
+            logger.warning(f"Failed to index cache key {key}: {str(e)}")
+
+    def _stale_while_revalidate(self, vendor_id: int, cache_key: str, fetch_fn,
+                                soft_ttl: int, hard_ttl: int):
+        """
+        Serve whatever is cached immediately; past the soft expiry, kick a
+        background refresh (one per key across processes, via a short
+        cache.add lock) so warm keys never block a request on the product
+        service.
+
+        Args:
+            vendor_id: Vendor the value belongs to, for the key index
+            cache_key: Cache key for the value
+            fetch_fn: Zero-argument callable returning the fresh value
+            soft_ttl: Seconds a value is considered fresh
+            hard_ttl: Seconds before the entry is evicted entirely
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        entry = cache.get(cache_key)
+        if entry is not None:
+            if isinstance(entry, tuple) and len(entry) == 2:
+                value, soft_expiry = entry
+                if time.time() >= soft_expiry and cache.add(f"refresh_lock_{cache_key}", 1, 30):
+                    self._refresh_executor.submit(
+                        self._refresh_entry, vendor_id, cache_key, fetch_fn, soft_ttl, hard_ttl
+                    )
+                return value
+            # Entry written without an envelope (e.g. by the batch paths)
+            return entry
+
+        return self._fetch_and_store(vendor_id, cache_key, fetch_fn, soft_ttl, hard_ttl)
+
+    def _fetch_and_store(self, vendor_id: int, cache_key: str, fetch_fn,
+                         soft_ttl: int, hard_ttl: int):
+        """
+        Single-flight cold-cache fetch: within the process, concurrent
+        callers for the same key share one Future; across workers, a short
+        cache.add lock makes the losers poll the cache for the winner's
+        result instead of duplicating the upstream call.
+        """
+        # A recent failure for this key means the service is likely still
+        # down; fail fast instead of re-hammering it from every caller
+        if cache.get(f"negcache:{cache_key}"):
+            raise ProductServiceError(
+                "Product service recently failed for this request",
+                status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not is_leader:
+            return future.result(timeout=self.timeout)
+
+        lock_key = f"lock:{cache_key}"
+        owns_lock = cache.add(lock_key, 1, 10)
+        try:
+            if not owns_lock:
+                deadline = time.monotonic() + 3.0
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    entry = cache.get(cache_key)
+                    if entry is not None:
+                        value = _unwrap_swr(entry)
+                        future.set_result(value)
+                        return value
+                # Lock holder is slow or died; fetch ourselves rather than
+                # failing the request
+
+            value = fetch_fn()
+            self._cache_set(vendor_id, cache_key, (value, time.time() + soft_ttl), hard_ttl)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            # Brief negative cache: for the next few seconds callers get
+            # their fallback immediately, and the upstream sees one probe
+            # per window instead of a thundering herd
+            cache.set(f"negcache:{cache_key}", 1, 5)
+            future.set_exception(e)
+            raise
+        finally:
+            if owns_lock:
+                cache.delete(lock_key)
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _refresh_entry(self, vendor_id: int, cache_key: str, fetch_fn,
+                       soft_ttl: int, hard_ttl: int):
+        """
+        Background revalidation for a stale entry. Failures are logged and
+        the stale value keeps serving until the hard TTL evicts it.
+        """
+        try:
+            value = fetch_fn()
+            self._cache_set(vendor_id, cache_key, (value, time.time() + soft_ttl), hard_ttl)
+        except Exception as e:
+            logger.warning(f"Background cache refresh failed for {cache_key}: {str(e)}")
+        finally:
+            cache.delete(f"refresh_lock_{cache_key}")
+
+    def close(self):
+        """
+        Dispose of the pooled session and its sockets. Call from a
+        process-fork hook before reinitializing, as with the auth client.
+        """
+        self.session.close()
+
+    def _get_headers(self, additional_headers: Dict[str, str] = None) -> Dict[str, str]:
+        """
+        Get default headers for product service requests, merging in any
+        call-specific extras. Only allocates when extras are supplied.
+        """
+        if not additional_headers:
+            return self._default_headers
+        return {**self._default_headers, **additional_headers}
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Make HTTP request to product service with error handling.
+
+        Transient failures (connect/read errors, 429 and 5xx responses)
+        are retried by the urllib3 Retry policy mounted on the session's
+        adapter, which honors Retry-After and applies jittered backoff
+        without re-entering Python between attempts. Only idempotent
+        methods are replayed, so POST/PATCH never duplicate writes.
+        """
+        # Hot-path callers pass prebuilt absolute URLs; everything else
+        # still hands over a relative endpoint
+        if endpoint.startswith('http'):
+            url = endpoint
         else:
+            url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        # Defaults ride on the session; only merge when a caller adds extras
+        if 'headers' in kwargs:
             kwargs['headers'] = self._get_headers(kwargs['headers'])
-        
+
+        # Encode request bodies with orjson rather than stdlib json; the
+        # session's Content-Type default already marks them as JSON
+        if 'json' in kwargs:
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
+
         # Set timeout
         if 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
-        
-        last_exception = None
-        
-        for attempt in range(self.retry_attempts):
+
+        try:
+            logger.debug(f"Product service request: {method} {url}")
+            response = self.session.request(method, url, **kwargs)
+
+        except ProductServiceError:
+            raise
+        except (requests.Timeout, requests.ConnectionError, requests.exceptions.RetryError) as e:
+            logger.error(f"Product service request failed: {method} {url}: {str(e)}")
+            handle_service_exception("Product", e)
+        except Exception as e:
+            logger.error(f"Unexpected error contacting product service: {str(e)}")
+            handle_service_exception("Product", e)
+
+        # If successful, return response
+        if response.status_code < 400:
+            return response
+
+        # Handle specific error cases; 429s land here once the adapter's
+        # retry budget is spent
+        handler = self._STATUS_HANDLERS.get(response.status_code)
+        if handler is not None:
+            raise ProductServiceError(*handler)
+
+        # For other errors, try to extract error message; never let a
+        # parse failure mask the original HTTP error
+        error_msg = 'Unknown error'
+        if len(response.content) <= 4096:
             try:
-                logger.debug(f"Product service request: {method} {url} (attempt {attempt + 1})")
-                
-                response = requests.request(method, url, **kwargs)
-                
-                # If successful, return response
-                if response.status_code < 400:
-                    return response
-                
-                # Handle specific error cases
-                if response.status_code == 401:
-                    raise ProductServiceError("Authentication failed", status.HTTP_401_UNAUTHORIZED)
-                elif response.status_code == 403:
-                    raise ProductServiceError("Access forbidden", status.HTTP_403_FORBIDDEN)
-                elif response.status_code == 404:
-                    raise ProductServiceError("Resource not found", status.HTTP_404_NOT_FOUND)
-                elif response.status_code == 429:
-                    # Rate limiting - wait and retry
-                    retry_after = int(response.headers.get('Retry-After', 5))
-                    time.sleep(retry_after)
-                    continue
-                else:
-                    # For other errors, try to extract error message
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get('error', {}).get('message', 'Unknown error')
-                    except:
-                        error_msg = response.text or 'Unknown error'
-                    
-                    raise ProductServiceError(f"HTTP {response.status_code}: {error_msg}", response.status_code)
-            
-            except requests.Timeout as e:
-                last_exception = e
-                logger.warning(f"Product service timeout on attempt {attempt + 1}: {str(e)}")
-                if attempt < self.retry_attempts - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-            
-            except requests.ConnectionError as e:
-                last_exception = e
-                logger.error(f"Product service connection error on attempt {attempt + 1}: {str(e)}")
-                if attempt < self.retry_attempts - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-            
-            except ProductServiceError as e:
-                # Don't retry on business logic errors
-                raise e
-            
-            except Exception as e:
-                last_exception = e
-                logger.error(f"Unexpected error contacting product service on attempt {attempt + 1}: {str(e)}")
-                if attempt < self.retry_attempts - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-        
-        # If we've exhausted all retry attempts
-        if last_exception:
-            handle_service_exception("Product", last_exception)
-        else:
-            raise ProductServiceError("Failed to connect to product service after multiple attempts")
+                error_data = orjson.loads(response.content)
+                error_msg = (
+                    (error_data.get('error') or {}).get('message')
+                    or error_data.get('detail')
+                    or 'Unknown error'
+                )
+            except (ValueError, orjson.JSONDecodeError, AttributeError):
+                error_msg = response.text[:512] if response.content else 'Unknown error'
+
+        raise ProductServiceError(f"HTTP {response.status_code}: {error_msg}", response.status_code)
     
     def get_vendor_product_count(self, vendor_id: int) -> int:
         """
@@ -133,27 +311,19 @@ class ProductClient:
         Returns:
             Number of products
         """
-        cache_key = f"vendor_product_count_{vendor_id}"
-        
-        # Check cache first
-        cached_count = cache.get(cache_key)
-        if cached_count is not None:
-            return cached_count
-        
-        try:
+        def fetch():
             response = self._make_request(
                 'GET',
-                f'/api/vendors/{vendor_id}/products/count/'
+                self._product_count_url % vendor_id
             )
-            
-            data = response.json()
-            count = data.get('count', 0)
-            
-            # Cache for 5 minutes
-            cache.set(cache_key, count, 300)
-            
-            return count
-            
+            return orjson.loads(response.content).get('count', 0)
+
+        try:
+            # Fresh for 5 minutes, servable-stale for 5 more
+            return self._stale_while_revalidate(
+                vendor_id, f"vendor_product_count_{vendor_id}", fetch, 300, 600
+            )
+
         except Exception as e:
             logger.error(f"Failed to get product count for vendor {vendor_id}: {str(e)}")
             # Return 0 as fallback
@@ -173,34 +343,30 @@ class ProductClient:
         Returns:
             Dict containing products and pagination info
         """
-        cache_key = f"vendor_products_{vendor_id}_page{page}_size{page_size}_status{status}"
-        
-        # Check cache first
-        cached_products = cache.get(cache_key)
-        if cached_products:
-            return cached_products
-        
-        try:
+        def fetch():
             params = {
                 'page': page,
                 'page_size': page_size
             }
             if status:
                 params['status'] = status
-            
+
             response = self._make_request(
                 'GET',
-                f'/api/vendors/{vendor_id}/products/',
+                self._products_url % vendor_id,
                 params=params
             )
-            
-            products_data = response.json()
-            
-            # Cache for 2 minutes (products can change frequently)
-            cache.set(cache_key, products_data, 120)
-            
-            return products_data
-            
+            return orjson.loads(response.content)
+
+        try:
+            # Fresh for 2 minutes (products can change frequently),
+            # servable-stale for 2 more
+            return self._stale_while_revalidate(
+                vendor_id,
+                _params_cache_key('vp', vendor_id, f"{page}|{page_size}|{status}"),
+                fetch, 120, 240
+            )
+
         except Exception as e:
             logger.error(f"Failed to get products for vendor {vendor_id}: {str(e)}")
             return {
@@ -222,26 +388,19 @@ class ProductClient:
         Returns:
             Dict containing product statistics
         """
-        cache_key = f"vendor_product_stats_{vendor_id}"
-        
-        # Check cache first
-        cached_stats = cache.get(cache_key)
-        if cached_stats:
-            return cached_stats
-        
-        try:
+        def fetch():
             response = self._make_request(
                 'GET',
-                f'/api/vendors/{vendor_id}/products/stats/'
+                self._product_stats_url % vendor_id
             )
-            
-            stats = response.json()
-            
-            # Cache for 10 minutes
-            cache.set(cache_key, stats, 600)
-            
-            return stats
-            
+            return orjson.loads(response.content)
+
+        try:
+            # Fresh for 10 minutes, servable-stale for 10 more
+            return self._stale_while_revalidate(
+                vendor_id, f"vendor_product_stats_{vendor_id}", fetch, 600, 1200
+            )
+
         except Exception as e:
             logger.error(f"Failed to get product stats for vendor {vendor_id}: {str(e)}")
             return {
@@ -272,13 +431,9 @@ class ProductClient:
                 json={'product_count_delta': delta}
             )
             
-            # Invalidate relevant caches
-            cache.delete_many([
-                f"vendor_product_count_{vendor_id}",
-                f"vendor_product_stats_{vendor_id}",
-                f"vendor_products_{vendor_id}_page1_size20_statusactive",
-                f"vendor_products_{vendor_id}_page1_size20_statusinactive"
-            ])
+            # Invalidate relevant caches; listing keys are hashed, so go
+            # through the per-vendor key index rather than guessing pages
+            self._invalidate_vendor_caches(vendor_id)
             
             return response.status_code == 200
             
@@ -310,10 +465,13 @@ class ProductClient:
             
             response = self._make_request('GET', '/api/categories/', params=params)
             
-            categories = response.json().get('results', [])
-            
+            categories = orjson.loads(response.content).get('results', [])
+
             # Cache for 1 hour (categories don't change often)
-            cache.set(cache_key, categories, 3600)
+            if vendor_id:
+                self._cache_set(vendor_id, cache_key, categories, 3600)
+            else:
+                cache.set(cache_key, categories, 3600)
             
             return categories
             
@@ -339,7 +497,7 @@ class ProductClient:
                 json=product_data
             )
             
-            created_product = response.json()
+            created_product = orjson.loads(response.content)
             
             # Invalidate relevant caches
             self._invalidate_vendor_caches(vendor_id)
@@ -369,7 +527,7 @@ class ProductClient:
                 json=update_data
             )
             
-            updated_product = response.json()
+            updated_product = orjson.loads(response.content)
             
             # Invalidate relevant caches
             self._invalidate_vendor_caches(vendor_id)
@@ -431,7 +589,7 @@ class ProductClient:
                 }
             )
             
-            result = response.json()
+            result = orjson.loads(response.content)
             
             # Invalidate relevant caches
             self._invalidate_vendor_caches(vendor_id)
@@ -460,7 +618,7 @@ class ProductClient:
                 params={'threshold': threshold}
             )
             
-            return response.json().get('results', [])
+            return orjson.loads(response.content).get('results', [])
             
         except Exception as e:
             logger.error(f"Failed to get low stock products for vendor {vendor_id}: {str(e)}")
@@ -477,27 +635,20 @@ class ProductClient:
         Returns:
             Dict containing product analytics
         """
-        cache_key = f"product_analytics_{vendor_id}_{period}"
-        
-        # Check cache first
-        cached_analytics = cache.get(cache_key)
-        if cached_analytics:
-            return cached_analytics
-        
-        try:
+        def fetch():
             response = self._make_request(
                 'GET',
-                f'/api/vendors/{vendor_id}/analytics/products/',
+                self._product_analytics_url % vendor_id,
                 params={'period': period}
             )
-            
-            analytics = response.json()
-            
-            # Cache for 15 minutes
-            cache.set(cache_key, analytics, 900)
-            
-            return analytics
-            
+            return orjson.loads(response.content)
+
+        try:
+            # Fresh for 15 minutes, servable-stale for 15 more
+            return self._stale_while_revalidate(
+                vendor_id, _params_cache_key('pa', vendor_id, period), fetch, 900, 1800
+            )
+
         except Exception as e:
             logger.error(f"Failed to get product analytics for vendor {vendor_id}: {str(e)}")
             return {}
@@ -534,25 +685,55 @@ class ProductClient:
         Args:
             vendor_id: ID of the vendor
         """
-        cache_patterns = [
-            f"vendor_product_count_{vendor_id}",
-            f"vendor_product_stats_{vendor_id}",
-            f"vendor_products_{vendor_id}_*",
-            f"product_analytics_{vendor_id}_*",
-        ]
-        
-        # Invalidate matching cache keys
-        for pattern in cache_patterns:
-            cache.delete_pattern(pattern)
+        # Delete exactly the keys this module wrote for the vendor (tracked
+        # in a Redis set by _cache_set) instead of delete_pattern, which
+        # SCANs the whole keyspace per glob
+        index_key = f"vendor_keys_{vendor_id}"
+        try:
+            redis_conn = get_redis_connection('default')
+            keys = redis_conn.smembers(index_key)
+            # One pipelined DEL for the indexed entries plus the index
+            # itself, instead of a round-trip per delete. The index stores
+            # logical cache keys, so apply the backend prefix before the
+            # raw DEL.
+            pipe = redis_conn.pipeline(transaction=False)
+            if keys:
+                pipe.delete(*[
+                    cache.make_key(key.decode() if isinstance(key, bytes) else key)
+                    for key in keys
+                ])
+            pipe.delete(index_key)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to invalidate caches for vendor {vendor_id}: {str(e)}")
 
 
 class CachedProductClient(ProductClient):
     """
     Extended product client with enhanced caching capabilities.
+
+    Constructed as a process-wide singleton via get_product_client(), so
+    the session pool and refresh executor are only allocated once and
+    only when first needed.
     """
-    
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
+        # __new__ hands back the same object on every construction, so
+        # guard against re-running setup and resetting live pools
+        if getattr(self, '_initialized', False):
+            return
         super().__init__()
+        self._initialized = True
         self.cache_ttl = {
             'product_count': 300,  # 5 minutes
             'product_stats': 600,  # 10 minutes
@@ -572,16 +753,11 @@ class CachedProductClient(ProductClient):
         Returns:
             Number of products
         """
-        cache_key = f"vendor_product_count_{vendor_id}"
-        
-        if not force_refresh:
-            cached_count = cache.get(cache_key)
-            if cached_count is not None:
-                return cached_count
-        
-        count = self.get_vendor_product_count(vendor_id)
-        cache.set(cache_key, count, self.cache_ttl['product_count'])
-        return count
+        if force_refresh:
+            # Evict so the read below fetches fresh from the service
+            cache.delete(f"vendor_product_count_{vendor_id}")
+
+        return self.get_vendor_product_count(vendor_id)
     
     def batch_get_vendor_product_counts(self, vendor_ids: List[int]) -> Dict[int, int]:
         """
@@ -596,32 +772,66 @@ class CachedProductClient(ProductClient):
         if not vendor_ids:
             return {}
         
-        result = {}
-        missing_ids = []
-        
-        # Check cache first
-        for vendor_id in vendor_ids:
-            cache_key = f"vendor_product_count_{vendor_id}"
-            cached_count = cache.get(cache_key)
-            if cached_count is not None:
-                result[vendor_id] = cached_count
-            else:
-                missing_ids.append(vendor_id)
-        
-        # Fetch missing counts individually (product service might not have batch endpoint)
-        for vendor_id in missing_ids:
+        # One pipelined MGET instead of a cache round-trip per vendor
+        keys = {f"vendor_product_count_{vendor_id}": vendor_id
+                for vendor_id in vendor_ids}
+        cached = cache.get_many(keys.keys())
+        result = {keys[key]: _unwrap_swr(count) for key, count in cached.items()}
+        missing_ids = [vid for key, vid in keys.items() if key not in cached]
+
+        # Fetch missing counts individually (product service might not have
+        # batch endpoint) but in parallel over the pooled session, so N
+        # misses cost roughly one RTT instead of N
+        if missing_ids:
+            fetched = {}
+            with ThreadPoolExecutor(max_workers=min(16, len(missing_ids))) as executor:
+                futures = {
+                    executor.submit(self.get_vendor_product_count, vendor_id): vendor_id
+                    for vendor_id in missing_ids
+                }
+                for future in as_completed(futures):
+                    vendor_id = futures[future]
+                    try:
+                        fetched[vendor_id] = future.result() or 0
+                    except Exception as e:
+                        logger.error(f"Failed to get product count for vendor {vendor_id}: {str(e)}")
+                        fetched[vendor_id] = 0
+
+            # One pipelined write-back for everything just fetched
+            cache.set_many(
+                {f"vendor_product_count_{vid}": count
+                 for vid, count in fetched.items()},
+                self.cache_ttl['product_count']
+            )
+            # Keep the per-vendor key indexes in sync in one pipeline
             try:
-                count = self.get_vendor_product_count(vendor_id)
-                result[vendor_id] = count
+                pipe = get_redis_connection('default').pipeline()
+                for vid in fetched:
+                    pipe.sadd(f"vendor_keys_{vid}", f"vendor_product_count_{vid}")
+                pipe.execute()
             except Exception as e:
-                logger.error(f"Failed to get product count for vendor {vendor_id}: {str(e)}")
-                result[vendor_id] = 0
-        
+                logger.warning(f"Failed to index batch cache keys: {str(e)}")
+            result.update(fetched)
+
         return result
 
 
-# Singleton instance for easy access
-product_client = CachedProductClient()
+def get_product_client() -> CachedProductClient:
+    """
+    Return the shared product client, constructing it on first use.
+
+    Deferring construction keeps settings access and connection-pool
+    allocation out of module import, which runs during Django startup.
+    """
+    return CachedProductClient()
+
+
+def __getattr__(name):
+    # Keep `from shared.clients.product_client import product_client`
+    # working without paying client construction at import time
+    if name == 'product_client':
+        return get_product_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Utility functions for common product operations
@@ -637,18 +847,17 @@ def update_vendor_product_metrics(vendor_id: int) -> bool:
     """
     try:
         # Get current product count
-        product_count = product_client.get_vendor_product_count(vendor_id)
+        product_count = get_product_client().get_vendor_product_count(vendor_id)
         
-        # Update vendor model (this would be called from vendor service)
+        # Update vendor model (this would be called from vendor service).
+        # A filtered UPDATE writes the one column without fetching the row
+        # first, and the rowcount doubles as the existence check.
         from apps.vendors.models import Vendor
-        try:
-            vendor = Vendor.objects.get(id=vendor_id)
-            vendor.total_products = product_count
-            vendor.save()
-            return True
-        except Vendor.DoesNotExist:
+        updated = Vendor.objects.filter(id=vendor_id).update(total_products=product_count)
+        if not updated:
             logger.error(f"Vendor {vendor_id} not found when updating product metrics")
             return False
+        return True
             
     except Exception as e:
         logger.error(f"Failed to update product metrics for vendor {vendor_id}: {str(e)}")
@@ -666,10 +875,19 @@ def get_vendor_product_summary(vendor_id: int) -> Dict[str, Any]:
         Dict containing product summary
     """
     try:
-        stats = product_client.get_vendor_product_stats(vendor_id)
-        analytics = product_client.get_product_analytics(vendor_id, '30d')
-        low_stock = product_client.get_low_stock_products(vendor_id)
-        
+        # Three independent round-trips; run them concurrently so the
+        # summary costs the slowest call, not the sum of all three. Each
+        # getter already degrades to its own fallback on failure.
+        client = get_product_client()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            stats_future = executor.submit(client.get_vendor_product_stats, vendor_id)
+            analytics_future = executor.submit(client.get_product_analytics, vendor_id, '30d')
+            low_stock_future = executor.submit(client.get_low_stock_products, vendor_id)
+
+            stats = stats_future.result()
+            analytics = analytics_future.result()
+            low_stock = low_stock_future.result()
+
         return {
             'stats': stats,
             'analytics': analytics,
@@ -0,0 +1,29 @@
+import json
+import logging
+
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+# Channel carrying vendor lifecycle events (approved, rejected, ...)
+VENDOR_EVENTS_CHANNEL = 'vendor.events'
+
+
+def notify(channel, payload):
+    """
+    Publish a fire-and-forget event to a Redis channel.
+
+    For notifications that need no retries or result tracking this is far
+    cheaper than a Celery dispatch: a single PUBLISH instead of a broker
+    round-trip with a serialized task envelope. A lightweight subscriber
+    process consumes the channel and sends the corresponding emails.
+
+    Args:
+        channel: Redis channel name to publish to
+        payload: JSON-serializable event body
+    """
+    try:
+        connection = get_redis_connection('default')
+        connection.publish(channel, json.dumps(payload))
+    except Exception as e:
+        logger.error(f"Failed to publish event to {channel}: {str(e)}")
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status
@@ -10,214 +11,372 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# Shared empty details dict; orjson cannot serialize a mappingproxy, so
+# this stays a plain dict that must never be mutated. Sharing it saves a
+# dict allocation per detail-less exception
+_EMPTY_DETAILS = {}
+
 
 class CustomException(Exception):
     """
     Base custom exception class for the application.
+
+    Message and details are built lazily: subclasses may pass a %-style
+    template with format_args (and a details_factory), which are only
+    rendered when .message or .details is read. Exceptions that are
+    caught and discarded without being logged or serialized never pay
+    for the string interpolation or dict allocation.
+
+    The hierarchy declares __slots__ so error storms (validation bursts,
+    rate limiting) allocate slots instead of a per-instance dict.
     """
-    def __init__(self, message, status_code=status.HTTP_400_BAD_REQUEST, details=None):
-        self.message = message
+    __slots__ = ('_message', '_template', '_format_args', 'status_code',
+                 '_details', '_details_factory')
+
+    def __init__(self, message, status_code=status.HTTP_400_BAD_REQUEST, details=None,
+                 format_args=(), details_factory=None):
+        self._message = None if format_args else message
+        self._template = message
+        self._format_args = format_args
         self.status_code = status_code
-        self.details = details or {}
-        super().__init__(self.message)
+        self._details = details
+        self._details_factory = details_factory
+        Exception.__init__(self)
+
+    @property
+    def message(self):
+        if self._message is None:
+            self._message = self._template % self._format_args
+        return self._message
+
+    @property
+    def details(self):
+        if self._details is None:
+            self._details = (self._details_factory() if self._details_factory
+                             else _EMPTY_DETAILS)
+        return self._details
+
+    def __str__(self):
+        return self.message
+
+
+def _init_custom(exc, template, status_code, details=None, format_args=(), details_factory=None):
+    """
+    Single-frame initializer for frequently raised leaf exceptions,
+    setting CustomException's state directly instead of walking a
+    three-deep super().__init__ chain on every raise.
+    """
+    exc._message = None if format_args else template
+    exc._template = template
+    exc._format_args = format_args
+    exc.status_code = status_code
+    exc._details = details
+    exc._details_factory = details_factory
+    Exception.__init__(exc)
 
 
 class VendorServiceException(CustomException):
     """Base exception for vendor service specific errors"""
-    pass
+    __slots__ = ()
 
 
 class VendorNotFoundError(VendorServiceException):
     """Raised when a vendor is not found"""
+    __slots__ = ()
     def __init__(self, vendor_id=None, message="Vendor not found"):
         if vendor_id:
-            message = f"Vendor with ID {vendor_id} not found"
-        super().__init__(message, status_code=status.HTTP_404_NOT_FOUND)
+            super().__init__("Vendor with ID %s not found",
+                             status_code=status.HTTP_404_NOT_FOUND,
+                             format_args=(vendor_id,))
+        else:
+            super().__init__(message, status_code=status.HTTP_404_NOT_FOUND)
 
 
 class VendorAlreadyExistsError(VendorServiceException):
     """Raised when trying to create a vendor that already exists"""
+    __slots__ = ()
     def __init__(self, user_id=None, business_name=None):
         if user_id:
-            message = f"Vendor account already exists for user {user_id}"
+            message, format_args = "Vendor account already exists for user %s", (user_id,)
         elif business_name:
-            message = f"Vendor with business name '{business_name}' already exists"
+            message, format_args = "Vendor with business name '%s' already exists", (business_name,)
         else:
-            message = "Vendor already exists"
-        super().__init__(message, status_code=status.HTTP_409_CONFLICT)
+            message, format_args = "Vendor already exists", ()
+        super().__init__(message, status_code=status.HTTP_409_CONFLICT, format_args=format_args)
 
 
 class VendorNotApprovedError(VendorServiceException):
     """Raised when a vendor tries to perform an action that requires approval"""
+    __slots__ = ()
     def __init__(self, vendor_id=None):
-        message = "Vendor account is not approved"
         if vendor_id:
-            message = f"Vendor {vendor_id} is not approved"
-        super().__init__(message, status_code=status.HTTP_403_FORBIDDEN)
+            super().__init__("Vendor %s is not approved",
+                             status_code=status.HTTP_403_FORBIDDEN,
+                             format_args=(vendor_id,))
+        else:
+            super().__init__("Vendor account is not approved",
+                             status_code=status.HTTP_403_FORBIDDEN)
 
 
 class VendorSuspendedError(VendorServiceException):
     """Raised when a suspended vendor tries to perform an action"""
+    __slots__ = ()
     def __init__(self, vendor_id=None):
-        message = "Vendor account is suspended"
         if vendor_id:
-            message = f"Vendor {vendor_id} is suspended"
-        super().__init__(message, status_code=status.HTTP_403_FORBIDDEN)
+            super().__init__("Vendor %s is suspended",
+                             status_code=status.HTTP_403_FORBIDDEN,
+                             format_args=(vendor_id,))
+        else:
+            super().__init__("Vendor account is suspended",
+                             status_code=status.HTTP_403_FORBIDDEN)
 
 
 class DocumentValidationError(VendorServiceException):
     """Raised when a document fails validation"""
+    __slots__ = ()
     def __init__(self, message="Document validation failed", details=None):
         super().__init__(message, status_code=status.HTTP_400_BAD_REQUEST, details=details)
 
 
 class DocumentNotFoundError(VendorServiceException):
     """Raised when a document is not found"""
+    __slots__ = ()
     def __init__(self, document_id=None):
-        message = "Document not found"
         if document_id:
-            message = f"Document with ID {document_id} not found"
-        super().__init__(message, status_code=status.HTTP_404_NOT_FOUND)
+            super().__init__("Document with ID %s not found",
+                             status_code=status.HTTP_404_NOT_FOUND,
+                             format_args=(document_id,))
+        else:
+            super().__init__("Document not found", status_code=status.HTTP_404_NOT_FOUND)
 
 
 class PayoutError(VendorServiceException):
     """Base exception for payout related errors"""
-    pass
+    __slots__ = ()
 
 
 class InsufficientBalanceError(PayoutError):
     """Raised when vendor has insufficient balance for payout"""
+    __slots__ = ()
     def __init__(self, available_balance, requested_amount):
-        message = f"Insufficient balance. Available: {available_balance}, Requested: {requested_amount}"
-        details = {
-            'available_balance': float(available_balance),
-            'requested_amount': float(requested_amount)
-        }
-        super().__init__(message, status_code=status.HTTP_400_BAD_REQUEST, details=details)
+        _init_custom(
+            self, "Insufficient balance. Available: %s, Requested: %s",
+            status.HTTP_400_BAD_REQUEST,
+            format_args=(available_balance, requested_amount),
+            details_factory=lambda: {
+                'available_balance': float(available_balance),
+                'requested_amount': float(requested_amount)
+            }
+        )
 
 
 class PayoutAccountError(PayoutError):
     """Raised when there's an issue with payout account"""
-    def __init__(self, message="Payout account error", details=None):
-        super().__init__(message, status_code=status.HTTP_400_BAD_REQUEST, details=details)
+    __slots__ = ()
+    def __init__(self, message="Payout account error", details=None, format_args=()):
+        super().__init__(message, status_code=status.HTTP_400_BAD_REQUEST,
+                         details=details, format_args=format_args)
 
 
 class PayoutAccountNotVerifiedError(PayoutAccountError):
     """Raised when trying to use an unverified payout account"""
+    __slots__ = ()
     def __init__(self, account_id=None):
-        message = "Payout account is not verified"
         if account_id:
-            message = f"Payout account {account_id} is not verified"
-        super().__init__(message)
+            _init_custom(self, "Payout account %s is not verified",
+                         status.HTTP_400_BAD_REQUEST, format_args=(account_id,))
+        else:
+            _init_custom(self, "Payout account is not verified",
+                         status.HTTP_400_BAD_REQUEST)
 
 
 class MinimumPayoutAmountError(PayoutError):
     """Raised when payout amount is below minimum threshold"""
+    __slots__ = ()
     def __init__(self, requested_amount, minimum_amount):
-        message = f"Payout amount {requested_amount} is below minimum {minimum_amount}"
-        details = {
-            'requested_amount': float(requested_amount),
-            'minimum_amount': float(minimum_amount)
-        }
-        super().__init__(message, status_code=status.HTTP_400_BAD_REQUEST, details=details)
+        _init_custom(
+            self, "Payout amount %s is below minimum %s",
+            status.HTTP_400_BAD_REQUEST,
+            format_args=(requested_amount, minimum_amount),
+            details_factory=lambda: {
+                'requested_amount': float(requested_amount),
+                'minimum_amount': float(minimum_amount)
+            }
+        )
 
 
 class ExternalServiceError(VendorServiceException):
     """Raised when there's an error communicating with external services"""
+    __slots__ = ('service_name',)
+
+    # Subclasses bake their service prefix into a class-level template so
+    # raising them does no string work at all
+    _TEMPLATE = None
+
     def __init__(self, service_name, message="External service error", status_code=None):
         self.service_name = service_name
-        full_message = f"{service_name} service error: {message}"
-        super().__init__(full_message, status_code=status_code or status.HTTP_503_SERVICE_UNAVAILABLE)
+        template = self._TEMPLATE
+        if template is not None:
+            super().__init__(template,
+                             status_code=status_code or status.HTTP_503_SERVICE_UNAVAILABLE,
+                             format_args=(message,))
+        else:
+            super().__init__("%s service error: %s",
+                             status_code=status_code or status.HTTP_503_SERVICE_UNAVAILABLE,
+                             format_args=(service_name, message))
 
 
 class AuthServiceError(ExternalServiceError):
     """Raised when there's an error with auth service"""
+    __slots__ = ()
+    _TEMPLATE = "Auth service error: %s"
+
     def __init__(self, message="Authentication service error", status_code=None):
-        super().__init__("Auth", message, status_code)
+        self.service_name = "Auth"
+        _init_custom(self, self._TEMPLATE,
+                     status_code or status.HTTP_503_SERVICE_UNAVAILABLE,
+                     format_args=(message,))
 
 
 class ProductServiceError(ExternalServiceError):
     """Raised when there's an error with product service"""
+    __slots__ = ()
+    _TEMPLATE = "Product service error: %s"
+
     def __init__(self, message="Product service error", status_code=None):
-        super().__init__("Product", message, status_code)
+        self.service_name = "Product"
+        _init_custom(self, self._TEMPLATE,
+                     status_code or status.HTTP_503_SERVICE_UNAVAILABLE,
+                     format_args=(message,))
 
 
 class OrderServiceError(ExternalServiceError):
     """Raised when there's an error with order service"""
+    __slots__ = ()
+    _TEMPLATE = "Order service error: %s"
+
     def __init__(self, message="Order service error", status_code=None):
-        super().__init__("Order", message, status_code)
+        self.service_name = "Order"
+        _init_custom(self, self._TEMPLATE,
+                     status_code or status.HTTP_503_SERVICE_UNAVAILABLE,
+                     format_args=(message,))
 
 
 class PaymentProcessorError(VendorServiceException):
     """Raised when there's an error with payment processors"""
+    __slots__ = ('processor_name',)
+
+    _TEMPLATE = None
+
     def __init__(self, processor_name, message="Payment processor error", details=None):
         self.processor_name = processor_name
-        full_message = f"{processor_name} error: {message}"
-        super().__init__(full_message, status_code=status.HTTP_502_BAD_GATEWAY, details=details)
+        template = self._TEMPLATE
+        if template is not None:
+            super().__init__(template, status_code=status.HTTP_502_BAD_GATEWAY,
+                             details=details, format_args=(message,))
+        else:
+            super().__init__("%s error: %s", status_code=status.HTTP_502_BAD_GATEWAY,
+                             details=details, format_args=(processor_name, message))
 
 
 class StripeError(PaymentProcessorError):
     """Raised when there's an error with Stripe"""
+    __slots__ = ()
+    _TEMPLATE = "Stripe error: %s"
+
     def __init__(self, message="Stripe payment error", details=None):
-        super().__init__("Stripe", message, details)
+        self.processor_name = "Stripe"
+        _init_custom(self, self._TEMPLATE, status.HTTP_502_BAD_GATEWAY,
+                     details=details, format_args=(message,))
 
 
 class PayPalError(PaymentProcessorError):
     """Raised when there's an error with PayPal"""
+    __slots__ = ()
+    _TEMPLATE = "PayPal error: %s"
+
     def __init__(self, message="PayPal payment error", details=None):
-        super().__init__("PayPal", message, details)
+        self.processor_name = "PayPal"
+        _init_custom(self, self._TEMPLATE, status.HTTP_502_BAD_GATEWAY,
+                     details=details, format_args=(message,))
 
 
 class FileUploadError(VendorServiceException):
     """Raised when there's an error with file uploads"""
-    def __init__(self, message="File upload error", details=None):
-        super().__init__(message, status_code=status.HTTP_400_BAD_REQUEST, details=details)
+    __slots__ = ()
+    def __init__(self, message="File upload error", details=None,
+                 format_args=(), details_factory=None):
+        super().__init__(message, status_code=status.HTTP_400_BAD_REQUEST, details=details,
+                         format_args=format_args, details_factory=details_factory)
 
 
 class FileSizeExceededError(FileUploadError):
     """Raised when uploaded file exceeds size limit"""
+    __slots__ = ()
     def __init__(self, file_size, max_size):
-        message = f"File size {file_size} exceeds maximum allowed size {max_size}"
-        details = {
-            'file_size': file_size,
-            'max_size': max_size
-        }
-        super().__init__(message, details=details)
+        _init_custom(
+            self, "File size %s exceeds maximum allowed size %s",
+            status.HTTP_400_BAD_REQUEST,
+            format_args=(file_size, max_size),
+            details_factory=lambda: {
+                'file_size': file_size,
+                'max_size': max_size
+            }
+        )
 
 
 class InvalidFileTypeError(FileUploadError):
     """Raised when uploaded file type is not allowed"""
+    __slots__ = ('_file_type', '_allowed_types')
+
     def __init__(self, file_type, allowed_types):
-        message = f"File type {file_type} is not allowed. Allowed types: {', '.join(allowed_types)}"
-        details = {
-            'file_type': file_type,
-            'allowed_types': allowed_types
-        }
-        super().__init__(message, details=details)
+        self._file_type = file_type
+        self._allowed_types = allowed_types
+        _init_custom(
+            self, None, status.HTTP_400_BAD_REQUEST,
+            details_factory=lambda: {
+                'file_type': file_type,
+                'allowed_types': allowed_types
+            }
+        )
+
+    @property
+    def message(self):
+        # The ', '.join over allowed_types is deferred too, since batch
+        # upload validators often catch and discard this exception
+        if self._message is None:
+            self._message = "File type %s is not allowed. Allowed types: %s" % (
+                self._file_type, ', '.join(self._allowed_types))
+        return self._message
 
 
 class BusinessValidationError(VendorServiceException):
     """Raised when business validation fails"""
+    __slots__ = ()
     def __init__(self, message="Business validation failed", details=None):
         super().__init__(message, status_code=status.HTTP_400_BAD_REQUEST, details=details)
 
 
 class OnboardingStepError(VendorServiceException):
     """Raised when there's an error in onboarding process"""
+    __slots__ = ()
     def __init__(self, step_name, message="Onboarding step error"):
-        full_message = f"Onboarding step '{step_name}' error: {message}"
-        super().__init__(full_message, status_code=status.HTTP_400_BAD_REQUEST)
+        super().__init__("Onboarding step '%s' error: %s",
+                         status_code=status.HTTP_400_BAD_REQUEST,
+                         format_args=(step_name, message))
 
 
 class ServiceUnavailableError(VendorServiceException):
     """Raised when a required service is unavailable"""
+    __slots__ = ()
     def __init__(self, service_name, message="Service temporarily unavailable"):
-        full_message = f"{service_name} {message}"
-        super().__init__(full_message, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        super().__init__("%s %s", status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                         format_args=(service_name, message))
 
 
 class RateLimitExceededError(VendorServiceException):
     """Raised when rate limit is exceeded"""
+    __slots__ = ()
     def __init__(self, message="Rate limit exceeded", retry_after=None):
         details = {}
         if retry_after:
@@ -225,6 +384,101 @@ class RateLimitExceededError(VendorServiceException):
         super().__init__(message, status_code=status.HTTP_429_TOO_MANY_REQUESTS, details=details)
 
 
+# Skeleton (payload, status) pairs for the fixed-message handler
+# branches, built once at import. The HTTP status rides only on the
+# Response now — bodies no longer duplicate it. Detail-less responses
+# share the payload itself (its details slot is the frozen empty mapping
+# and nothing downstream writes into response.data['error']); responses
+# with details copy it first.
+_NOT_FOUND_ERR = ({
+    'code': 'not_found',
+    'message': 'Resource not found',
+    'details': _EMPTY_DETAILS,
+}, status.HTTP_404_NOT_FOUND)
+_OBJECT_NOT_FOUND_ERR = ({
+    'code': 'not_found',
+    'message': 'Requested object not found',
+    'details': _EMPTY_DETAILS,
+}, status.HTTP_404_NOT_FOUND)
+_PERMISSION_DENIED_ERR = ({
+    'code': 'permission_denied',
+    'message': 'You do not have permission to perform this action',
+    'details': _EMPTY_DETAILS,
+}, status.HTTP_403_FORBIDDEN)
+_INTEGRITY_ERR = ({
+    'code': 'integrity_error',
+    'message': 'Database integrity error occurred',
+    'details': _EMPTY_DETAILS,
+}, status.HTTP_400_BAD_REQUEST)
+_DATABASE_ERR = ({
+    'code': 'database_error',
+    'message': 'Database error occurred',
+    'details': _EMPTY_DETAILS,
+}, status.HTTP_500_INTERNAL_SERVER_ERROR)
+_EXTERNAL_SERVICE_ERR = ({
+    'code': 'external_service_error',
+    'message': 'Error communicating with external service',
+    'details': _EMPTY_DETAILS,
+}, status.HTTP_502_BAD_GATEWAY)
+_SERVER_ERR = ({
+    'code': 'server_error',
+    'message': 'An unexpected error occurred',
+    'details': _EMPTY_DETAILS,
+}, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _error_response(template, details=None):
+    """Build a Response from a (payload, status) skeleton, filling in
+    details."""
+    err, status_code = template
+    if details is not None:
+        err = err.copy()
+        err['details'] = details
+    return Response({'error': err}, status=status_code)
+
+
+def _handle_http404(exc):
+    return _error_response(_NOT_FOUND_ERR, {'resource': str(exc)})
+
+
+def _handle_permission_denied(exc):
+    return _error_response(_PERMISSION_DENIED_ERR)
+
+
+def _handle_object_does_not_exist(exc):
+    return _error_response(_OBJECT_NOT_FOUND_ERR)
+
+
+def _handle_integrity_error(exc):
+    # %s args defer stringification to the logging framework, so a
+    # disabled logger costs nothing
+    logger.error("Integrity error: %s", exc)
+    return _error_response(_INTEGRITY_ERR)
+
+
+def _handle_database_error(exc):
+    logger.error("Database error: %s", exc)
+    return _error_response(_DATABASE_ERR)
+
+
+def _handle_request_exception(exc):
+    logger.error("External service request error: %s", exc)
+    return _error_response(_EXTERNAL_SERVICE_ERR, {'service': 'unknown'})
+
+
+# Exact-type dispatch for the unhandled-exception branches; order matters
+# for the isinstance fallback (IntegrityError before its DatabaseError
+# base, mirroring the old elif chain)
+_EXC_HANDLERS = {
+    Http404: _handle_http404,
+    PermissionDenied: _handle_permission_denied,
+    ObjectDoesNotExist: _handle_object_does_not_exist,
+    IntegrityError: _handle_integrity_error,
+    DatabaseError: _handle_database_error,
+    requests.RequestException: _handle_request_exception,
+}
+
+
 def custom_exception_handler(exc, context):
     """
     Custom exception handler for DRF that provides consistent error responses.
@@ -240,111 +494,52 @@ def custom_exception_handler(exc, context):
                 'error': {
                     'code': 'custom_error',
                     'message': exc.message,
-                    'details': exc.details,
-                    'status_code': exc.status_code
+                    'details': exc.details
                 }
             }
             response = Response(response_data, status=exc.status_code)
         
-        elif isinstance(exc, Http404):
-            response_data = {
-                'error': {
-                    'code': 'not_found',
-                    'message': 'Resource not found',
-                    'details': {'resource': str(exc)},
-                    'status_code': status.HTTP_404_NOT_FOUND
-                }
-            }
-            response = Response(response_data, status=status.HTTP_404_NOT_FOUND)
-        
-        elif isinstance(exc, PermissionDenied):
-            response_data = {
-                'error': {
-                    'code': 'permission_denied',
-                    'message': 'You do not have permission to perform this action',
-                    'details': {},
-                    'status_code': status.HTTP_403_FORBIDDEN
-                }
-            }
-            response = Response(response_data, status=status.HTTP_403_FORBIDDEN)
-        
-        elif isinstance(exc, ObjectDoesNotExist):
-            response_data = {
-                'error': {
-                    'code': 'not_found',
-                    'message': 'Requested object not found',
-                    'details': {},
-                    'status_code': status.HTTP_404_NOT_FOUND
-                }
-            }
-            response = Response(response_data, status=status.HTTP_404_NOT_FOUND)
-        
-        elif isinstance(exc, IntegrityError):
-            logger.error(f"Integrity error: {str(exc)}")
-            response_data = {
-                'error': {
-                    'code': 'integrity_error',
-                    'message': 'Database integrity error occurred',
-                    'details': {},
-                    'status_code': status.HTTP_400_BAD_REQUEST
-                }
-            }
-            response = Response(response_data, status=status.HTTP_400_BAD_REQUEST)
-        
-        elif isinstance(exc, DatabaseError):
-            logger.error(f"Database error: {str(exc)}")
-            response_data = {
-                'error': {
-                    'code': 'database_error',
-                    'message': 'Database error occurred',
-                    'details': {},
-                    'status_code': status.HTTP_500_INTERNAL_SERVER_ERROR
-                }
-            }
-            response = Response(response_data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-        elif isinstance(exc, requests.RequestException):
-            logger.error(f"External service request error: {str(exc)}")
-            response_data = {
-                'error': {
-                    'code': 'external_service_error',
-                    'message': 'Error communicating with external service',
-                    'details': {'service': 'unknown'},
-                    'status_code': status.HTTP_502_BAD_GATEWAY
-                }
-            }
-            response = Response(response_data, status=status.HTTP_502_BAD_GATEWAY)
-        
         else:
-            # Log unexpected exceptions
-            logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-            response_data = {
-                'error': {
-                    'code': 'server_error',
-                    'message': 'An unexpected error occurred',
-                    'details': {},
-                    'status_code': status.HTTP_500_INTERNAL_SERVER_ERROR
-                }
-            }
-            response = Response(response_data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            # One dict probe on the exact type covers the common cases;
+            # subclasses fall back to an isinstance walk over the same
+            # table in its declared order
+            handler = _EXC_HANDLERS.get(type(exc))
+            if handler is None:
+                for cls, fn in _EXC_HANDLERS.items():
+                    if isinstance(exc, cls):
+                        handler = fn
+                        break
+
+            if handler is not None:
+                response = handler(exc)
+            else:
+                # Log unexpected exceptions; guard so a disabled logger
+                # skips the traceback capture entirely
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error("Unhandled exception: %s", exc, exc_info=True)
+                response = _error_response(_SERVER_ERR)
     
     else:
         # Handle DRF exceptions and format response consistently
         if isinstance(exc, ValidationError):
-            # Format validation errors consistently
-            error_details = {}
-            if hasattr(exc, 'detail'):
-                if isinstance(exc.detail, dict):
-                    error_details = exc.detail
-                elif isinstance(exc.detail, list):
-                    error_details = {'non_field_errors': exc.detail}
+            # Format validation errors consistently. DRF hands detail
+            # over as plain dict/list subclasses, so one type() probe
+            # resolves the common shapes without repeated isinstance
+            # walks; odd subclasses fall back to the mapping check.
+            detail = getattr(exc, 'detail', None)
+            detail_type = type(detail)
+            if detail_type is dict or isinstance(detail, dict):
+                error_details = detail
+            elif detail_type is list or isinstance(detail, list):
+                error_details = {'non_field_errors': detail}
+            else:
+                error_details = {}
             
             response_data = {
                 'error': {
                     'code': 'validation_error',
                     'message': 'Invalid input data',
-                    'details': error_details,
-                    'status_code': response.status_code
+                    'details': error_details
                 }
             }
         else:
@@ -354,40 +549,62 @@ def custom_exception_handler(exc, context):
                 'error': {
                     'code': 'api_error',
                     'message': error_message,
-                    'details': {},
-                    'status_code': response.status_code
+                    'details': {}
                 }
             }
         
         response.data = response_data
     
-    # Add request ID for tracing if available
+    # Add request ID for tracing if available; getattr with a default
+    # skips the exception machinery hasattr pays for on the miss path
     request = context.get('request')
-    if request and hasattr(request, 'id'):
-        response.data['request_id'] = request.id
+    request_id = getattr(request, 'id', None) if request is not None else None
+    if request_id is not None:
+        response.data['request_id'] = request_id
     
     return response
 
 
+# Message/status pairs for the well-known upstream HTTP errors, resolved
+# with one dict probe instead of an if/elif ladder per failure
+_HTTP_STATUS_MESSAGES = {
+    404: ('Resource not found', status.HTTP_404_NOT_FOUND),
+    401: ('Authentication failed', status.HTTP_401_UNAUTHORIZED),
+    403: ('Access forbidden', status.HTTP_403_FORBIDDEN),
+}
+
+def _http_error_factory(service_name, exception):
+    code = exception.response.status_code
+    msg, sc = _HTTP_STATUS_MESSAGES.get(code, (None, None))
+    if msg is None:
+        msg = f"HTTP error: {code}"
+    return ExternalServiceError(service_name, msg, sc)
+
+
+# Type->factory table for upstream failures; Timeout is listed first so
+# ConnectTimeout (a subclass of both) resolves the way the old elif
+# chain did
+_REQ_HANDLERS = {
+    requests.Timeout: lambda svc, exc: ServiceUnavailableError(svc, "Request timeout"),
+    requests.ConnectionError: lambda svc, exc: ServiceUnavailableError(svc, "Connection error"),
+    requests.HTTPError: _http_error_factory,
+}
+
+
 def handle_service_exception(service_name, exception):
     """
     Helper function to handle exceptions from external services.
     """
-    if isinstance(exception, requests.Timeout):
-        raise ServiceUnavailableError(service_name, "Request timeout")
-    elif isinstance(exception, requests.ConnectionError):
-        raise ServiceUnavailableError(service_name, "Connection error")
-    elif isinstance(exception, requests.HTTPError):
-        if exception.response.status_code == 404:
-            raise ExternalServiceError(service_name, "Resource not found", status.HTTP_404_NOT_FOUND)
-        elif exception.response.status_code == 401:
-            raise ExternalServiceError(service_name, "Authentication failed", status.HTTP_401_UNAUTHORIZED)
-        elif exception.response.status_code == 403:
-            raise ExternalServiceError(service_name, "Access forbidden", status.HTTP_403_FORBIDDEN)
-        else:
-            raise ExternalServiceError(service_name, f"HTTP error: {exception.response.status_code}")
-    else:
+    factory = _REQ_HANDLERS.get(type(exception))
+    if factory is None:
+        for cls, fn in _REQ_HANDLERS.items():
+            if isinstance(exception, cls):
+                factory = fn
+                break
+
+    if factory is None:
         raise ExternalServiceError(service_name, str(exception))
+    raise factory(service_name, exception)
 
 
 class ErrorCodes:
@@ -439,15 +656,18 @@ class ErrorCodes:
     SERVER_ERROR = "server_error"
 
 
+@lru_cache(maxsize=256)
+def _code_skeleton(code):
+    """Memoized base payload for an error code; callers copy it and fill
+    in the per-call message and details."""
+    return {'code': code}
+
+
 def create_error_response(code, message, details=None, status_code=status.HTTP_400_BAD_REQUEST):
     """
     Helper function to create consistent error responses.
     """
-    return Response({
-        'error': {
-            'code': code,
-            'message': message,
-            'details': details or {},
-            'status_code': status_code
-        }
-    }, status=status_code)
\ No newline at end of file
+    err = _code_skeleton(code).copy()
+    err['message'] = message
+    err['details'] = details or {}
+    return Response({'error': err}, status=status_code)
\ No newline at end of file
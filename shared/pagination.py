@@ -1,11 +1,219 @@
 from rest_framework.pagination import PageNumberPagination, CursorPagination
 from rest_framework.response import Response
 from rest_framework.utils.urls import replace_query_param
-from collections import OrderedDict
 from django.conf import settings
-from django.core.paginator import InvalidPage
-from rest_framework.exceptions import NotFound
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, Paginator
+from django.db.models import Count, Max, Q
+from django.utils.functional import cached_property
+from django.http import HttpResponse
+from rest_framework.exceptions import NotFound, ValidationError
+from shared.renderers import OrjsonRenderer
+import hashlib
 import math
+import re
+import time
+
+# Path-keyword patterns used by DynamicPagination; one C-level scan per
+# pattern replaces the per-request any(... in path ...) loops
+_EXPORT_RE = re.compile(r'export|report|download', re.IGNORECASE)
+_DASHBOARD_RE = re.compile(r'dashboard|analytics', re.IGNORECASE)
+_SEARCH_RE = re.compile(r'search|filter', re.IGNORECASE)
+
+# Rows beyond which the paginator stops counting; deep listings report
+# the cap instead of paying a full-table COUNT(*) per request
+COUNT_CAP = getattr(settings, 'PAGINATION_COUNT_CAP', 20000)
+
+# Tables too large to ever serve unpaginated; NoPagination refuses them
+LARGE_TABLES = frozenset(getattr(settings, 'PAGINATION_LARGE_TABLES', ()))
+
+# Seconds a memoized COUNT(*) stays valid; slight staleness in totals is
+# fine, repeated identical count queries per page view are not
+COUNT_CACHE_TTL = getattr(settings, 'PAGINATION_COUNT_CACHE_TTL', 30)
+
+# Seconds a fully rendered page body stays cached for repeat identical
+# requests against public listings
+RENDERED_CACHE_TTL = getattr(settings, 'PAGINATION_RENDERED_CACHE_TTL', 60)
+
+
+def _count_cache_key(queryset):
+    """
+    Cache key for a queryset's memoized count, or None when the queryset
+    cannot be keyed by its compiled SQL.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except Exception:
+        return None
+    return 'pgcount:' + hashlib.blake2b(
+        f"{sql}|{params!r}".encode(), digest_size=16
+    ).hexdigest()
+
+
+def _cached_count(queryset):
+    """
+    queryset.count() memoized for COUNT_CACHE_TTL seconds, keyed by the
+    compiled SQL and params, so identical listings across requests and
+    workers share one count query instead of re-running it each time.
+    """
+    key = _count_cache_key(queryset)
+    if key is None:
+        return queryset.count()
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, COUNT_CACHE_TTL)
+    return count
+
+
+class CappedCountPaginator(Paginator):
+    """
+    Paginator whose COUNT(*) is capped at COUNT_CAP rows.
+
+    The count query runs over a LIMITed subquery, so the database scans
+    at most COUNT_CAP + 1 rows however large the table gets. When the
+    cap is hit, `capped` is set and the reported count (and therefore
+    num_pages) is the cap itself.
+    """
+    capped = False
+
+    @cached_property
+    def count(self):
+        try:
+            counted = _cached_count(self.object_list[:COUNT_CAP + 1])
+        except (AttributeError, TypeError):
+            # Plain sequences (lists) don't support the capped count
+            return len(self.object_list)
+        if counted > COUNT_CAP:
+            self.capped = True
+            return COUNT_CAP
+        return counted
+
+
+# Constant portions of the OpenAPI response schemas, built once; the
+# per-endpoint `results` schema is merged in at call time
+_STANDARD_SCHEMA_BASE = {
+    'type': 'object',
+    'properties': {
+        'pagination': {
+            'type': 'object',
+            'properties': {
+                'count': {
+                    'type': 'integer',
+                    'example': 123,
+                    'description': 'Total number of items across all pages'
+                },
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                    'example': 'http://api.example.org/vendors/?page=4',
+                    'description': 'URL to the next page of results'
+                },
+                'previous': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                    'example': 'http://api.example.org/vendors/?page=2',
+                    'description': 'URL to the previous page of results'
+                },
+                'current_page': {
+                    'type': 'integer',
+                    'example': 3,
+                    'description': 'Current page number'
+                },
+                'total_pages': {
+                    'type': 'integer',
+                    'example': 5,
+                    'description': 'Total number of pages'
+                },
+                'page_size': {
+                    'type': 'integer',
+                    'example': 25,
+                    'description': 'Number of items per page'
+                },
+                'has_next': {
+                    'type': 'boolean',
+                    'example': True,
+                    'description': 'Whether there is a next page'
+                },
+                'has_previous': {
+                    'type': 'boolean',
+                    'example': True,
+                    'description': 'Whether there is a previous page'
+                },
+            },
+            'required': ['count', 'next', 'previous', 'current_page', 'total_pages', 'page_size']
+        },
+    },
+    'required': ['pagination', 'results']
+}
+
+_CURSOR_SCHEMA_BASE = {
+    'type': 'object',
+    'properties': {
+        'pagination': {
+            'type': 'object',
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                    'example': 'http://api.example.org/vendors/?cursor=cD0yMDIzLTA5LTE0',
+                },
+                'previous': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                    'example': 'http://api.example.org/vendors/?cursor=cj0xJnA9MjAyMy0wOS0xMw',
+                },
+                'page_size': {
+                    'type': 'integer',
+                    'example': 20,
+                },
+                'count': {
+                    'type': 'integer',
+                    'nullable': True,
+                    'example': 123,
+                },
+                'has_next': {
+                    'type': 'boolean',
+                    'example': True,
+                },
+                'has_previous': {
+                    'type': 'boolean',
+                    'example': False,
+                },
+            },
+        },
+    },
+}
+
+
+class PkSliceQuerysetPaginator(CappedCountPaginator):
+    """
+    Paginator that slices on primary keys before fetching full rows.
+
+    Deep OFFSET/LIMIT over wide vendor rows forces the database to
+    materialize and discard every skipped row including joined columns.
+    Paging the pk column first keeps the offset scan on the index, then a
+    second query fetches only the page's rows by pk. The queryset's
+    ordering applies to both queries, so page contents are unchanged.
+    """
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        qs = self.object_list
+        try:
+            pks = list(qs.values_list('pk', flat=True)[bottom:top])
+        except (AttributeError, TypeError):
+            # Plain sequences slice directly
+            return self._get_page(qs[bottom:top], number, self)
+        return self._get_page(qs.filter(pk__in=pks), number, self)
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -17,86 +225,103 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = getattr(settings, 'MAX_PAGE_SIZE', 100)
     page_query_param = 'page'
-    
+    django_paginator_class = CappedCountPaginator
+
     def get_paginated_response(self, data):
         """
         Override to provide consistent pagination response format.
         """
-        return Response(OrderedDict([
-            ('pagination', OrderedDict([
-                ('count', self.page.paginator.count),
-                ('next', self.get_next_link()),
-                ('previous', self.get_previous_link()),
-                ('current_page', self.page.number),
-                ('total_pages', self.page.paginator.num_pages),
-                ('page_size', self.get_page_size(self.request)),
-                ('has_next', self.page.has_next()),
-                ('has_previous', self.page.has_previous()),
-            ])),
-            ('results', data)
-        ]))
+        # Hoist the attribute chains once; has_next/has_previous reduce
+        # to integer comparisons against the hoisted values
+        page = self.page
+        paginator = page.paginator
+        number = page.number
+        num_pages = paginator.num_pages
+        return Response({
+            'pagination': {
+                'count': paginator.count,
+                'count_is_estimate': paginator.capped,
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'current_page': number,
+                'total_pages': num_pages,
+                'page_size': self.get_page_size(self.request),
+                'has_next': number < num_pages,
+                'has_previous': number > 1,
+            },
+            'results': data
+        })
+    
+    def _collect_shared_aggregates(self, queryset):
+        """
+        Run one aggregate covering the listing's common statistics.
+        
+        Stats helpers on views (get_vendor_statistics and friends) can
+        read `paginator.shared_aggregates` instead of issuing their own
+        aggregation queries, and the total seeds the memoized page count
+        so the paginator's COUNT query is skipped as well.
+        """
+        try:
+            aggregates = queryset.aggregate(
+                total=Count('pk'),
+                approved=Count('pk', filter=Q(status='approved')),
+                latest_updated_at=Max('updated_at'),
+            )
+        except Exception:
+            self.shared_aggregates = None
+            return None
+        self.shared_aggregates = aggregates
+        key = _count_cache_key(queryset[:COUNT_CAP + 1])
+        if key is not None:
+            cache.set(key, aggregates['total'], COUNT_CACHE_TTL)
+        return aggregates
+    
+    def cache_key_for_request(self, request, queryset):
+        """
+        Cache key identifying a fully rendered page of this queryset.
+        
+        Keyed on the compiled SQL, page, page size and Accept header, so
+        any filter or ordering change produces a different key. Returns
+        None when the queryset cannot be keyed (plain lists).
+        """
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except Exception:
+            return None
+        raw = (
+            f"{sql}|{params!r}"
+            f"|{request.query_params.get(self.page_query_param, '1')}"
+            f"|{self.get_page_size(request)}"
+            f"|{request.META.get('HTTP_ACCEPT', '')}"
+        )
+        return 'pgresp:' + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    
+    def get_cached_rendered_response(self, request, queryset, data_builder):
+        """
+        Serve a cached JSON body for repeat identical page requests.
+        
+        On a hit the stored bytes go straight out as an HttpResponse,
+        skipping the queryset, serializer and renderer entirely. On a
+        miss `data_builder()` runs as usual and its payload is rendered
+        once more into the cache for the next hit.
+        """
+        key = self.cache_key_for_request(request, queryset)
+        if key is None:
+            return data_builder()
+        cached = cache.get(key)
+        if cached is not None:
+            return HttpResponse(cached, content_type='application/json')
+        response = data_builder()
+        cache.set(key, OrjsonRenderer().render(response.data), RENDERED_CACHE_TTL)
+        return response
     
     def get_paginated_response_schema(self, schema):
         """
         Override to provide OpenAPI schema for paginated responses.
         """
-        return {
-            'type': 'object',
-            'properties': {
-                'pagination': {
-                    'type': 'object',
-                    'properties': {
-                        'count': {
-                            'type': 'integer',
-                            'example': 123,
-                            'description': 'Total number of items across all pages'
-                        },
-                        'next': {
-                            'type': 'string',
-                            'nullable': True,
-                            'format': 'uri',
-                            'example': 'http://api.example.org/vendors/?page=4',
-                            'description': 'URL to the next page of results'
-                        },
-                        'previous': {
-                            'type': 'string',
-                            'nullable': True,
-                            'format': 'uri',
-                            'example': 'http://api.example.org/vendors/?page=2',
-                            'description': 'URL to the previous page of results'
-                        },
-                        'current_page': {
-                            'type': 'integer',
-                            'example': 3,
-                            'description': 'Current page number'
-                        },
-                        'total_pages': {
-                            'type': 'integer',
-                            'example': 5,
-                            'description': 'Total number of pages'
-                        },
-                        'page_size': {
-                            'type': 'integer',
-                            'example': 25,
-                            'description': 'Number of items per page'
-                        },
-                        'has_next': {
-                            'type': 'boolean',
-                            'example': True,
-                            'description': 'Whether there is a next page'
-                        },
-                        'has_previous': {
-                            'type': 'boolean',
-                            'example': True,
-                            'description': 'Whether there is a previous page'
-                        },
-                    },
-                    'required': ['count', 'next', 'previous', 'current_page', 'total_pages', 'page_size']
-                },
-                'results': schema,
-            },
-            'required': ['pagination', 'results']
-        }
+        out = _STANDARD_SCHEMA_BASE.copy()
+        out['properties'] = {**out['properties'], 'results': schema}
+        return out
 
 
 class LargeResultsSetPagination(PageNumberPagination):
@@ -108,21 +333,29 @@ class LargeResultsSetPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 500
     page_query_param = 'page'
+    django_paginator_class = CappedCountPaginator
     
     def get_paginated_response(self, data):
-        return Response(OrderedDict([
-            ('pagination', OrderedDict([
-                ('count', self.page.paginator.count),
-                ('next', self.get_next_link()),
-                ('previous', self.get_previous_link()),
-                ('current_page', self.page.number),
-                ('total_pages', self.page.paginator.num_pages),
-                ('page_size', self.get_page_size(self.request)),
-                ('has_next', self.page.has_next()),
-                ('has_previous', self.page.has_previous()),
-            ])),
-            ('results', data)
-        ]))
+        # Hoist the attribute chains once; has_next/has_previous reduce
+        # to integer comparisons against the hoisted values
+        page = self.page
+        paginator = page.paginator
+        number = page.number
+        num_pages = paginator.num_pages
+        return Response({
+            'pagination': {
+                'count': paginator.count,
+                'count_is_estimate': paginator.capped,
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'current_page': number,
+                'total_pages': num_pages,
+                'page_size': self.get_page_size(self.request),
+                'has_next': number < num_pages,
+                'has_previous': number > 1,
+            },
+            'results': data
+        })
 
 
 class SmallResultsSetPagination(PageNumberPagination):
@@ -134,21 +367,29 @@ class SmallResultsSetPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 50
     page_query_param = 'page'
+    django_paginator_class = CappedCountPaginator
     
     def get_paginated_response(self, data):
-        return Response(OrderedDict([
-            ('pagination', OrderedDict([
-                ('count', self.page.paginator.count),
-                ('next', self.get_next_link()),
-                ('previous', self.get_previous_link()),
-                ('current_page', self.page.number),
-                ('total_pages', self.page.paginator.num_pages),
-                ('page_size', self.get_page_size(self.request)),
-                ('has_next', self.page.has_next()),
-                ('has_previous', self.page.has_previous()),
-            ])),
-            ('results', data)
-        ]))
+        # Hoist the attribute chains once; has_next/has_previous reduce
+        # to integer comparisons against the hoisted values
+        page = self.page
+        paginator = page.paginator
+        number = page.number
+        num_pages = paginator.num_pages
+        return Response({
+            'pagination': {
+                'count': paginator.count,
+                'count_is_estimate': paginator.capped,
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'current_page': number,
+                'total_pages': num_pages,
+                'page_size': self.get_page_size(self.request),
+                'has_next': number < num_pages,
+                'has_previous': number > 1,
+            },
+            'results': data
+        })
 
 
 class VendorPagination(StandardResultsSetPagination):
@@ -160,6 +401,7 @@ class VendorPagination(StandardResultsSetPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
     page_query_param = 'page'
+    django_paginator_class = PkSliceQuerysetPaginator
     
     def get_paginated_response(self, data):
         response = super().get_paginated_response(data)
@@ -168,21 +410,35 @@ class VendorPagination(StandardResultsSetPagination):
         if hasattr(self, 'vendor_stats'):
             response.data['pagination']['vendor_stats'] = self.vendor_stats
         
-        # Add range information for better UX
-        if self.page.paginator.count > 0:
+        # Add range information for better UX; the page slice is already
+        # evaluated, so truthiness costs no extra query
+        if self.page.object_list:
             start_index = self.page.start_index()
             end_index = self.page.end_index()
-            response.data['pagination']['range'] = f"{start_index}-{end_index}"
+            response.data['pagination']['range'] = '%d-%d' % (start_index, end_index)
             response.data['pagination']['start_index'] = start_index
             response.data['pagination']['end_index'] = end_index
         
+        # Cheap validators for public listings: repeat hits within
+        # max-age skip the backend, and unchanged pages revalidate as
+        # 304 through ConditionalGetMiddleware without re-serializing
+        response['Cache-Control'] = 'public, max-age=30, stale-while-revalidate=60'
+        etag = hashlib.blake2b(
+            f"{self.page.paginator.count}:{self.page.number}:{self._max_updated_at}".encode(),
+            digest_size=8,
+        ).hexdigest()
+        response['ETag'] = f'"{etag}"'
+        
         return response
     
     def paginate_queryset(self, queryset, request, view=None):
         """
         Override to capture vendor-specific statistics.
         """
-        self.request = request
+        # One aggregate feeds the ETag, the stats helpers and the
+        # paginator's count
+        aggregates = self._collect_shared_aggregates(queryset)
+        self._max_updated_at = aggregates['latest_updated_at'] if aggregates else None
         
         # Get vendor statistics before pagination
         if hasattr(view, 'get_vendor_statistics'):
@@ -199,6 +455,7 @@ class AdminVendorPagination(StandardResultsSetPagination):
     page_size_query_param = 'page_size'
     max_page_size = 200
     page_query_param = 'page'
+    django_paginator_class = PkSliceQuerysetPaginator
     
     def get_paginated_response(self, data):
         response = super().get_paginated_response(data)
@@ -217,7 +474,8 @@ class AdminVendorPagination(StandardResultsSetPagination):
         """
         Override to capture admin-specific statistics.
         """
-        self.request = request
+        # One aggregate feeds the stats helpers and the paginator's count
+        self._collect_shared_aggregates(queryset)
         
         # Calculate summary statistics for admin dashboard
         if hasattr(view, 'get_admin_summary_stats'):
@@ -243,67 +501,31 @@ class CursorPaginationWithCount(CursorPagination):
         """
         Include total count in cursor pagination (use carefully for large datasets).
         """
-        return Response(OrderedDict([
-            ('pagination', OrderedDict([
-                ('next', self.get_next_link()),
-                ('previous', self.get_previous_link()),
-                ('page_size', self.page_size),
-                ('count', getattr(self, 'count', None)),
-                ('has_next', bool(self.get_next_link())),
-                ('has_previous', bool(self.get_previous_link())),
-            ])),
-            ('results', data)
-        ]))
+        return Response({
+            'pagination': {
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'page_size': self.page_size,
+                'count': getattr(self, 'count', None),
+                'has_next': bool(self.get_next_link()),
+                'has_previous': bool(self.get_previous_link()),
+            },
+            'results': data
+        })
     
     def paginate_queryset(self, queryset, request, view=None):
         """
         Override to calculate total count.
         """
-        # Calculate total count (expensive for large datasets)
-        self.count = queryset.count()
+        # Calculate total count (expensive for large datasets, so the
+        # result is briefly memoized across requests)
+        self.count = _cached_count(queryset)
         return super().paginate_queryset(queryset, request, view)
     
     def get_paginated_response_schema(self, schema):
-        return {
-            'type': 'object',
-            'properties': {
-                'pagination': {
-                    'type': 'object',
-                    'properties': {
-                        'next': {
-                            'type': 'string',
-                            'nullable': True,
-                            'format': 'uri',
-                            'example': 'http://api.example.org/vendors/?cursor=cD0yMDIzLTA5LTE0',
-                        },
-                        'previous': {
-                            'type': 'string',
-                            'nullable': True,
-                            'format': 'uri',
-                            'example': 'http://api.example.org/vendors/?cursor=cj0xJnA9MjAyMy0wOS0xMw',
-                        },
-                        'page_size': {
-                            'type': 'integer',
-                            'example': 20,
-                        },
-                        'count': {
-                            'type': 'integer',
-                            'nullable': True,
-                            'example': 123,
-                        },
-                        'has_next': {
-                            'type': 'boolean',
-                            'example': True,
-                        },
-                        'has_previous': {
-                            'type': 'boolean',
-                            'example': False,
-                        },
-                    },
-                },
-                'results': schema,
-            },
-        }
+        out = _CURSOR_SCHEMA_BASE.copy()
+        out['properties'] = {**out['properties'], 'results': schema}
+        return out
 
 
 class DynamicPagination(PageNumberPagination):
@@ -314,14 +536,23 @@ class DynamicPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 200
     page_query_param = 'page'
+    django_paginator_class = CappedCountPaginator
     
     def get_page_size(self, request):
         """
         Override to provide dynamic page sizes based on various factors.
+
+        The result is memoized per paginator instance: DRF calls this
+        during paginate_queryset and again while building the response,
+        and the role/path scanning below only needs to run once.
         """
+        cached = getattr(self, '_cached_page_size', None)
+        if cached is not None:
+            return cached
+
         # Store original max page size
         original_max_page_size = self.max_page_size
-        
+
         try:
             # Adjust based on user role
             if hasattr(request, 'user') and request.user.is_authenticated:
@@ -329,62 +560,77 @@ class DynamicPagination(PageNumberPagination):
                     self.max_page_size = 500  # Allow larger pages for admins
                 elif request.user.is_vendor:
                     self.max_page_size = 100  # Reasonable limit for vendors
-            
+
             # Adjust based on endpoint type
-            path = request.path.lower()
-            
-            if any(keyword in path for keyword in ['export', 'report', 'download']):
+            path = request.path
+
+            if _EXPORT_RE.search(path):
                 self.max_page_size = 1000  # Larger pages for data exports
-            elif any(keyword in path for keyword in ['dashboard', 'analytics']):
+            elif _DASHBOARD_RE.search(path):
                 self.max_page_size = 50  # Smaller pages for dashboard data
-            elif any(keyword in path for keyword in ['search', 'filter']):
+            elif _SEARCH_RE.search(path):
                 self.max_page_size = 100  # Moderate pages for search results
-            
-            # Check for explicit page size in query params
-            if self.page_size_query_param in request.query_params:
-                try:
-                    page_size = int(request.query_params[self.page_size_query_param])
-                    if page_size > 0:
-                        return min(page_size, self.max_page_size)
-                except (ValueError, TypeError):
-                    pass
-            
-            return self.page_size
-            
+
+            # Check for explicit page size in query params; isdecimal
+            # screens out exactly what int() rejects, without exception
+            # setup
+            result = self.page_size
+            raw = request.query_params.get(self.page_size_query_param)
+            if raw is not None and raw.isdecimal():
+                page_size = int(raw)
+                if page_size > 0:
+                    result = min(page_size, self.max_page_size)
+
+            self._cached_page_size = result
+            return result
+
         finally:
             # Restore original max page size to avoid side effects
             self.max_page_size = original_max_page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Override to reset the memoized page size for each new request.
+        """
+        self._cached_page_size = None
+        return super().paginate_queryset(queryset, request, view)
     
     def get_paginated_response(self, data):
         """
         Include additional pagination metadata and range information.
         """
-        pagination_data = OrderedDict([
-            ('count', self.page.paginator.count),
-            ('next', self.get_next_link()),
-            ('previous', self.get_previous_link()),
-            ('current_page', self.page.number),
-            ('total_pages', self.page.paginator.num_pages),
-            ('page_size', self.get_page_size(self.request)),
-            ('has_next', self.page.has_next()),
-            ('has_previous', self.page.has_previous()),
-        ])
-        
-        # Add range information for better UX
-        if self.page.paginator.count > 0:
-            start_index = self.page.start_index()
-            end_index = self.page.end_index()
-            pagination_data['range'] = f"{start_index}-{end_index}"
+        page = self.page
+        paginator = page.paginator
+        number = page.number
+        num_pages = paginator.num_pages
+        pagination_data = {
+            'count': paginator.count,
+            'count_is_estimate': paginator.capped,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'current_page': number,
+            'total_pages': num_pages,
+            'page_size': self.get_page_size(self.request),
+            'has_next': number < num_pages,
+            'has_previous': number > 1,
+        }
+        
+        # Add range information for better UX; the page slice is already
+        # evaluated, so truthiness costs no extra query
+        if page.object_list:
+            start_index = page.start_index()
+            end_index = page.end_index()
+            pagination_data['range'] = '%d-%d' % (start_index, end_index)
             pagination_data['start_index'] = start_index
             pagination_data['end_index'] = end_index
         
         # Add page number links for navigation
         pagination_data['page_links'] = self.get_page_links()
         
-        return Response(OrderedDict([
-            ('pagination', pagination_data),
-            ('results', data)
-        ]))
+        return Response({
+            'pagination': pagination_data,
+            'results': data
+        })
     
     def get_page_links(self):
         """
@@ -396,6 +642,15 @@ class DynamicPagination(PageNumberPagination):
         if total_pages <= 1:
             return []
         
+        # Build the absolute URL once; per-page links only swap the page
+        # query parameter
+        base_url = self.request.build_absolute_uri() if self.request else None
+        
+        def _page_url(page_number):
+            if base_url is None:
+                return None
+            return replace_query_param(base_url, self.page_query_param, page_number)
+        
         # Define the range of pages to show around current page
         delta = 2
         left_bound = max(1, current_page - delta)
@@ -405,18 +660,20 @@ class DynamicPagination(PageNumberPagination):
         
         # Add first page and ellipsis if needed
         if left_bound > 1:
-            page_links.append({'page': 1, 'url': self.get_page_url(1), 'type': 'number'})
+            page_links.append({'page': 1, 'url': _page_url(1), 'type': 'number'})
             if left_bound > 2:
                 page_links.append({'page': '...', 'url': None, 'type': 'ellipsis'})
         
         # Add page numbers in range
-        for page in range(left_bound, right_bound + 1):
-            page_links.append({
+        page_links.extend(
+            {
                 'page': page,
-                'url': self.get_page_url(page),
+                'url': _page_url(page),
                 'type': 'number',
                 'current': page == current_page
-            })
+            }
+            for page in range(left_bound, right_bound + 1)
+        )
         
         # Add last page and ellipsis if needed
         if right_bound < total_pages:
@@ -424,7 +681,7 @@ class DynamicPagination(PageNumberPagination):
                 page_links.append({'page': '...', 'url': None, 'type': 'ellipsis'})
             page_links.append({
                 'page': total_pages,
-                'url': self.get_page_url(total_pages),
+                'url': _page_url(total_pages),
                 'type': 'number'
             })
         
@@ -454,9 +711,16 @@ class NoPagination(PageNumberPagination):
         """
         Return all results without pagination.
         """
+        if queryset.model._meta.db_table in LARGE_TABLES:
+            raise ValidationError(
+                'This endpoint cannot return unpaginated results for this dataset.'
+            )
         self.request = request
-        self.count = queryset.count()
-        return list(queryset)
+        # Materialize in chunks and count the rows we already have instead
+        # of issuing a separate COUNT query
+        rows = list(queryset.iterator(chunk_size=2000))
+        self.count = len(rows)
+        return rows
     
     def get_paginated_response(self, data):
         """
@@ -497,6 +761,41 @@ class NoPagination(PageNumberPagination):
         }
 
 
+# Per-model queryset optimizers resolved once by OptimizedVendorPagination;
+# maps model class -> callable applying the relations that actually exist
+_OPT_CACHE = {}
+
+
+def _queryset_optimizer(model):
+    """
+    Resolve which of the vendor relations exist on `model`, once, and
+    return a callable applying the matching select/prefetch clauses.
+    """
+    optimizer = _OPT_CACHE.get(model)
+    if optimizer is None:
+        if hasattr(model, 'vendor_optimized_queryset'):
+            def optimizer(qs):
+                return model.vendor_optimized_queryset()
+        else:
+            names = {field.name for field in model._meta.get_fields()}
+            select = 'analytics' in names
+            prefetch = 'documents' in names
+            if select and prefetch:
+                def optimizer(qs):
+                    return qs.select_related('analytics').prefetch_related('documents')
+            elif select:
+                def optimizer(qs):
+                    return qs.select_related('analytics')
+            elif prefetch:
+                def optimizer(qs):
+                    return qs.prefetch_related('documents')
+            else:
+                def optimizer(qs):
+                    return qs
+        _OPT_CACHE[model] = optimizer
+    return optimizer
+
+
 class OptimizedVendorPagination(PageNumberPagination):
     """
     Optimized pagination for vendor listings with performance considerations.
@@ -506,18 +805,16 @@ class OptimizedVendorPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
     page_query_param = 'page'
+    django_paginator_class = PkSliceQuerysetPaginator
     
     def paginate_queryset(self, queryset, request, view=None):
         """
         Override to optimize queryset with select_related and prefetch_related.
         """
         # Optimize the queryset for vendor listings
-        if hasattr(queryset.model, 'vendor_optimized_queryset'):
-            queryset = queryset.model.vendor_optimized_queryset()
-        else:
-            # Default optimizations for vendor models
-            queryset = queryset.select_related('analytics').prefetch_related('documents')
+        queryset = _queryset_optimizer(queryset.model)(queryset)
         
+        self.start_time = time.perf_counter()
         return super().paginate_queryset(queryset, request, view)
     
     def get_paginated_response(self, data):
@@ -527,9 +824,8 @@ class OptimizedVendorPagination(PageNumberPagination):
         response = super().get_paginated_response(data)
         
         # Add performance information
-        import time
         if hasattr(self, 'start_time'):
-            response.data['pagination']['response_time'] = time.time() - self.start_time
+            response.data['pagination']['response_time'] = time.perf_counter() - self.start_time
         
         return response
 
@@ -557,18 +853,22 @@ class PaginationMixin:
         paginator = pagination_class()
         
         # Apply pagination configuration
-        for key, value in self.pagination_config.items():
+        for key, value in self.get_pagination_config().items():
             if hasattr(paginator, key):
                 setattr(paginator, key, value)
         
-        paginator.request = self.request
+        # paginate_queryset assigns paginator.request inside DRF
         return paginator
     
     def get_pagination_config(self):
         """
         Override to provide dynamic pagination configuration.
+        
+        The returned dict is only read, never mutated, so the class-level
+        mapping is returned as-is; overrides that adjust values should
+        build their own dict.
         """
-        return self.pagination_config.copy()
+        return self.pagination_config
     
     def paginate_queryset(self, queryset):
         """
@@ -599,7 +899,6 @@ def paginate_queryset(queryset, request, pagination_class=StandardResultsSetPagi
         if hasattr(paginator, key):
             setattr(paginator, key, value)
     
-    paginator.request = request
     page = paginator.paginate_queryset(queryset, request)
     return page, paginator
 
@@ -664,6 +963,19 @@ class PaginationConfig:
         'public_vendors': VENDOR,
     }
     
+    # Type-name lookup built once at class definition instead of per call
+    _TYPE_MAP = {
+        'standard': STANDARD,
+        'large': LARGE,
+        'small': SMALL,
+        'vendor': VENDOR,
+        'admin': ADMIN_VENDOR,
+        'cursor': CURSOR,
+        'dynamic': DYNAMIC,
+        'optimized': OPTIMIZED,
+        'none': NONE,
+    }
+    
     @classmethod
     def get_pagination_class(cls, pagination_type='standard', endpoint=None):
         """
@@ -676,21 +988,12 @@ class PaginationConfig:
         Returns:
             Pagination class
         """
-        if endpoint and endpoint in cls.ENDPOINT_PAGINATION:
-            return cls.ENDPOINT_PAGINATION[endpoint]
-        
-        pagination_map = {
-            'standard': cls.STANDARD,
-            'large': cls.LARGE,
-            'small': cls.SMALL,
-            'vendor': cls.VENDOR,
-            'admin': cls.ADMIN_VENDOR,
-            'cursor': cls.CURSOR,
-            'dynamic': cls.DYNAMIC,
-            'optimized': cls.OPTIMIZED,
-            'none': cls.NONE,
-        }
-        return pagination_map.get(pagination_type, cls.STANDARD)
+        if endpoint:
+            pagination_class = cls.ENDPOINT_PAGINATION.get(endpoint)
+            if pagination_class is not None:
+                return pagination_class
+        
+        return cls._TYPE_MAP.get(pagination_type, cls.STANDARD)
     
     @classmethod
     def get_page_size(cls, size_name='standard'):
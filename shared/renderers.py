@@ -0,0 +1,35 @@
+import decimal
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson for faster response encoding.
+
+    Falls back to DRF's default JSONRenderer when orjson is not installed.
+    """
+    media_type = 'application/json'
+    format = 'json'
+
+    @staticmethod
+    def _default(obj):
+        # orjson handles datetime/date/UUID natively; render Decimal as a
+        # string to match DRF's default output shape
+        if isinstance(obj, decimal.Decimal):
+            return str(obj)
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        return orjson.dumps(data, default=self._default)